@@ -1,56 +1,206 @@
 import time
 import heapq
-import random
+import numpy as np
+from abc import ABC, abstractmethod
 from collections import deque
+from maze import INF_DISTANCE, NO_PARENT, SMALL_FRONTIER, attached_maze, bfs_level, share_walls
+
+class IndexedHeap:
+    """Tam sayı hücre indeksleriyle anahtarlanan, decrease-key destekli ikili yığın.
+    
+    positions sözlüğü her elemanın yığındaki yerini tutar; böylece üyelik
+    kontrolü O(1), öncelik düşürme O(log n) olur.
+    """
+    
+    def __init__(self):
+        self.keys = []
+        self.items = []
+        self.positions = {}
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __contains__(self, item):
+        return item in self.positions
+    
+    def push(self, item, key):
+        """Elemanı ekle; zaten varsa ve yeni anahtar daha küçükse önceliğini düşür."""
+        position = self.positions.get(item)
+        if position is None:
+            self.keys.append(key)
+            self.items.append(item)
+            self._sift_up(len(self.items) - 1)
+        elif key < self.keys[position]:
+            self.keys[position] = key
+            self._sift_up(position)
+    
+    def peek(self):
+        """En küçük anahtarı çıkarmadan döndür."""
+        return self.keys[0]
+    
+    def pop(self):
+        """En küçük anahtarlı elemanı (eleman, anahtar) olarak çıkar."""
+        item, key = self.items[0], self.keys[0]
+        del self.positions[item]
+        last_item, last_key = self.items.pop(), self.keys.pop()
+        if self.items:
+            self.items[0], self.keys[0] = last_item, last_key
+            self.positions[last_item] = 0
+            self._sift_down(0)
+        return item, key
+    
+    def _sift_up(self, position):
+        keys, items, positions = self.keys, self.items, self.positions
+        key, item = keys[position], items[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if not key < keys[parent]:
+                break
+            keys[position], items[position] = keys[parent], items[parent]
+            positions[items[position]] = position
+            position = parent
+        keys[position], items[position] = key, item
+        positions[item] = position
+    
+    def _sift_down(self, position):
+        keys, items, positions = self.keys, self.items, self.positions
+        size = len(items)
+        key, item = keys[position], items[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < key:
+                break
+            keys[position], items[position] = keys[child], items[child]
+            positions[items[position]] = position
+            position = child
+        keys[position], items[position] = key, item
+        positions[item] = position
+
+class SolverMetrics:
+    """Çözücü sayaçları - tüm algoritmalarda aynı anlamla tutulur.
+    
+    discovered:   ilk kez ulaşılan farklı hücre sayısı (başlangıç dahil)
+    expansions:   komşuları incelenen hücre sayısı (IDS'te tekrarlar da sayılır)
+    pushes, pops: sınır yapısına (kuyruk, yığın, öncelik kuyruğu) ekleme/çıkarma
+    max_frontier: sınır yapısının ulaştığı en büyük boyut
+    """
+    
+    FIELDS = ("discovered", "expansions", "pushes", "pops", "max_frontier")
+    
+    def __init__(self):
+        self.discovered = 0
+        self.expansions = 0
+        self.pushes = 0
+        self.pops = 0
+        self.max_frontier = 0
+    
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+    
+    def __repr__(self):
+        return "SolverMetrics(" + ", ".join(f"{field}={getattr(self, field)}" for field in self.FIELDS) + ")"
+
+def manhattan(index, cols, target):
+    """Hücre indeksi ile target hücresi arasındaki Manhattan mesafesi."""
+    row, col = divmod(index, cols)
+    return abs(row - target.row) + abs(col - target.col)
 
 class MazeSolvingAlgorithm:
-    """Temel labirent çözme algoritması sınıfı."""
+    """Temel labirent çözme algoritması sınıfı.
+    
+    Arama durumu (ebeveynler, ziyaret bit haritası, çözüm yolu) hücre
+    indeksine göre algoritmanın kendi dizilerinde tutulur; labirent çözüm
+    sırasında salt okunurdur. Böylece aynı labirent üzerinde birden fazla
+    algoritma birbirinin verisini ezmeden çalışabilir.
+    
+    Sayaçlar metrics (SolverMetrics) içindedir. on_expand verilirse her
+    genişletmede on_expand(algoritma, hücre_indeksi) çağrılır; None iken
+    maliyeti tek bir karşılaştırmadır.
+    """
     
     def __init__(self, maze):
         self.maze = maze
         self.start_cell = maze.start_cell
         self.end_cell = maze.end_cell
         self.current_cell = None
-        self.visited_cells = set()
+        self.parent = None  # int32 ebeveyn dizisi (NO_PARENT = ebeveyn yok)
+        self.visited = None  # Ziyaret bit haritası (bool dizi)
+        self.backward_visited = None  # Bitişten başlayan aramanın bit haritası (sadece çift yönlü aramalar)
         self.path = []
+        self.solution_cells = set()  # Çözüm yolundaki hücre indeksleri (reconstruct_path doldurur)
+        self.show_visited = True  # False ise ziyaret izleri çizilmez, sadece çözüm yolu görünür
         self.solution_found = False
         self._is_finished = False  # Özel değişken, is_finished() metodu tarafından kullanılacak
-        self.visited_count = 0
+        self.metrics = SolverMetrics()
+        self.on_expand = None  # İsteğe bağlı profil kancası: on_expand(algoritma, hücre_indeksi)
         self.path_length = 0
         self.start_time = 0
         self.elapsed_time = 0
+        self.adjacency = None  # Labirentin paylaşılan komşuluk indeksi (CSR)
+        self.verbose = True  # False ise adım mesajları yazdırılmaz (toplu çalıştırma için)
+        # Çizim için değişen hücreler (Maze.dirty_cells ile aynı mantık)
+        self.dirty_cells = set()
+        self.dirty_limit = maze.dirty_limit
+        self.full_redraw = True
         self.name = "Base Algorithm"
     
     def initialize(self):
         """Algoritmayı başlat."""
-        # Tüm hücrelerin yol verilerini sıfırla
-        for row in self.maze.grid:
-            for cell in row:
-                cell.reset_path_data()
+        # Komşuluk indeksini al (labirent değişmediyse önbellekten gelir)
+        self.adjacency = self.maze.get_adjacency()
         
         # Başlangıç ve bitiş hücrelerini al
         self.start_cell = self.maze.start_cell
         self.end_cell = self.maze.end_cell
         
-        # Başlangıçı işaretle
-        self.start_cell.is_start = True
-        self.end_cell.is_end = True
+        # Arama dizilerini sıfırdan oluştur
+        self.parent = np.full(self.maze.size, NO_PARENT, dtype=np.int32)
+        self.visited = np.zeros(self.maze.size, dtype=bool)
+        self.visited[self.start_cell.index] = True
         
         self.current_cell = self.start_cell
-        self.visited_cells = set([self.start_cell])
-        self.current_cell.visited = True
         self.path = [self.current_cell]
+        self.solution_cells = set()
+        self.show_visited = True
         self.solution_found = False
         self._is_finished = False
-        self.visited_count = 1
+        self.metrics = SolverMetrics()
+        self.metrics.discovered = 1
         self.path_length = 0
         self.start_time = time.time()
         self.elapsed_time = 0
+        self.mark_all_dirty()
+    
+    @property
+    def visited_count(self):
+        """Ulaşılan farklı hücre sayısı (metrics.discovered)."""
+        return self.metrics.discovered
     
     def is_finished(self):
         """Algoritmanın tamamlanıp tamamlanmadığını kontrol et."""
         return self._is_finished
     
+    def log(self, message):
+        """verbose açıksa algoritma mesajını yazdır."""
+        if self.verbose:
+            print(message)
+    
+    def mark_dirty(self, index):
+        """Hücrenin bir sonraki karede yeniden çizilmesi gerektiğini işaretle."""
+        if not self.full_redraw:
+            self.dirty_cells.add(index)
+            if len(self.dirty_cells) > self.dirty_limit:
+                self.mark_all_dirty()
+    
+    def mark_all_dirty(self):
+        """Tüm labirentin bir sonraki karede yeniden çizilmesini iste."""
+        self.full_redraw = True
+        self.dirty_cells = set()
+    
     def step(self):
         """Algoritmanın bir adımını gerçekleştir."""
         if self._is_finished:
@@ -66,36 +216,78 @@ class MazeSolvingAlgorithm:
         
         return False
     
+    def trace_path(self):
+        """Ebeveyn dizisini bitişten başlangıca izle (başlangıç hariç indeks listesi)."""
+        parent = self.parent
+        start = self.start_cell.index
+        current = self.end_cell.index
+        path = []
+        while current != NO_PARENT and current != start:
+            path.append(current)
+            current = int(parent[current])
+        return path
+    
     def reconstruct_path(self):
         """Çözüm yolunu yeniden oluştur ve hücreleri işaretle."""
         if not self.solution_found:
             return
         
-        # Çözüm yolunu işaretle (varsa ebeveyn zinciri ile)
-        current = self.end_cell
-        path = []
+        # Çözüm yolunu ebeveyn zinciri ile bul
+        path = self.trace_path()
         
-        while current and current != self.start_cell:
-            path.append(current)
-            current.is_solution = True
-            current.is_path = True  # Çözüm yolundaki hücreler de path olarak işaretlenir
-            current = current.parent
+        # Yol uzunluğunu hesapla
+        self.path_length = len(path)
         
         # Başlangıç noktasını ekle
-        if self.start_cell:
-            self.start_cell.is_solution = True
-            self.start_cell.is_path = True  # Başlangıç da path olarak işaretlenir
+        path.append(self.start_cell.index)
         
-        # Yol uzunluğunu hesapla
-        self.path_length = len(path)
+        # Çözüm yolu üyeliğini bir kez hesapla; çizim her karede buradan okur
+        self.solution_cells = set(path)
+        for index in path:
+            self.mark_dirty(index)
     
-    def mark_visited(self, cell):
-        """Ziyaret edilen hücreyi işaretle."""
-        if cell not in self.visited_cells:
-            cell.visited = True
-            # cell.is_path = True  # Bu satırı kaldırıyorum, böylece ziyaret edilen yerler sarı olmayacak
-            self.visited_cells.add(cell)
-            self.visited_count += 1
+    def get_solution_path(self):
+        """Çözüm yolunu başlangıçtan bitişe hücre listesi olarak döndür."""
+        if not self.solution_found:
+            return []
+        
+        path = self.trace_path()
+        path.append(self.start_cell.index)
+        path.reverse()
+        return [self.maze.cell_at(index) for index in path]
+    
+    def mark_visited(self, index):
+        """Hücreye ilk kez ulaşıldıysa işaretle ve say."""
+        if not self.visited[index]:
+            self.visited[index] = True
+            self.metrics.discovered += 1
+            self.mark_dirty(index)
+    
+    def mark_visited_many(self, indices):
+        """Bir hücre dizisini birlikte işaretle ve say (vektörel çözücüler için)."""
+        fresh = indices[~self.visited[indices]]
+        self.visited[fresh] = True
+        self.metrics.discovered += len(fresh)
+        if len(fresh) > self.dirty_limit:
+            self.mark_all_dirty()
+        else:
+            for index in fresh.tolist():
+                self.mark_dirty(index)
+    
+    def expanded(self, index, frontier_size):
+        """Bir hücrenin genişletildiğini kaydet (komşuları sınıra eklendikten sonra çağrılır)."""
+        metrics = self.metrics
+        metrics.expansions += 1
+        if frontier_size > metrics.max_frontier:
+            metrics.max_frontier = frontier_size
+        if self.on_expand is not None:
+            self.on_expand(self, index)
+    
+    def hide_visited(self):
+        """Ziyaret izlerini gizle, sadece çözüm yolu görünsün (arama verisi korunur)."""
+        if self.show_visited:
+            self.show_visited = False
+            self.mark_all_dirty()
 
 class WallFollower(MazeSolvingAlgorithm):
     """Duvar Takip Algoritması (Right-Hand Rule)."""
@@ -112,6 +304,7 @@ class WallFollower(MazeSolvingAlgorithm):
             "up": (-1, 0), "right": (0, 1), "down": (1, 0), "left": (0, -1)
         }
         self.path_cells = []  # Ziyaret edilen hücrelerin sırasını takip etmek için
+        self.solution_path = []  # Bitişten başlangıca doğru çözüm yolu
     
     def initialize(self):
         super().initialize()
@@ -130,7 +323,7 @@ class WallFollower(MazeSolvingAlgorithm):
             self.elapsed_time = time.time() - self.start_time
             # Özel path takibimizi kullanarak reconstruct_path'i çağıralım
             self.reconstruct_path_from_visited()
-            print("WallFollower: Hedef noktaya ulaşıldı!")
+            self.log("WallFollower: Hedef noktaya ulaşıldı!")
             return True
         
         # Sağ el kuralını uygula
@@ -158,9 +351,10 @@ class WallFollower(MazeSolvingAlgorithm):
                     next_cell = self.maze.grid[next_row][next_col]
                     
                     # Hücreyi ziyaret et
-                    next_cell.parent = self.current_cell  # Bu hücrenin parent'ı current_cell'dir
+                    self.parent[next_cell.index] = self.current_cell.index  # Bu hücrenin parent'ı current_cell'dir
+                    self.expanded(self.current_cell.index, 0)
                     self.current_cell = next_cell
-                    self.mark_visited(next_cell)
+                    self.mark_visited(next_cell.index)
                     self.facing = test_direction
                     
                     # Ziyaret edilen hücreyi path'e ekle
@@ -172,7 +366,7 @@ class WallFollower(MazeSolvingAlgorithm):
         # Eğer hiçbir yöne hareket edilemezse
         if not moved:
             self._is_finished = True
-            print("WallFollower: Hareket edilecek yer kalmadı!")
+            self.log("WallFollower: Hareket edilecek yer kalmadı!")
             return True
         
         # Her adımdan sonra hedef kontrolü
@@ -184,7 +378,7 @@ class WallFollower(MazeSolvingAlgorithm):
             # Özel path takibimizi kullanarak reconstruct_path'i çağıralım
             self.reconstruct_path_from_visited()
             
-            print("WallFollower: Hedef noktaya ulaşıldı!")
+            self.log("WallFollower: Hedef noktaya ulaşıldı!")
             return True
         
         return False
@@ -194,22 +388,13 @@ class WallFollower(MazeSolvingAlgorithm):
         if not self.solution_found:
             return
             
-        # Önce tüm ziyaret izlerini temizle
-        for row in self.maze.grid:
-            for cell in row:
-                cell.is_path = False
-                cell.is_solution = False
-        
-        # Başlangıç ve bitiş hücrelerini tekrar işaretle
-        self.start_cell.is_start = True
-        self.end_cell.is_end = True
-        
         # WallFollower'da daha doğru bir çözüm yolu oluşturmak için
         # ziyaret ettiğimiz tüm yolu biriktiriyoruz
         path = self.path_cells
         
         # Çözüm için ters yöne doğru yol bulma işlemi
         solution_path = []
+        self.solution_path = solution_path
         
         # Öncelikle end_cell'den başlayarak parent zincirini izleriz
         # Ancak bazen parent zinciri eksik olabileceği için biriktirdiğimiz path'ten faydalanırız
@@ -217,8 +402,6 @@ class WallFollower(MazeSolvingAlgorithm):
         
         # End_cell'i solution path'e ekleyelim
         solution_path.append(current)
-        current.is_solution = True
-        current.is_path = True
         
         # Path'in sonundan başlayarak end_cell'e kadar geri gidelim
         # Bu, duvar takip algoritmasının en doğru yol oluşturma şeklidir
@@ -227,8 +410,6 @@ class WallFollower(MazeSolvingAlgorithm):
             
             # Eğer current'ın komşusuysa (aralarında duvar yoksa), bu solution path'in bir parçasıdır
             if self.are_neighbors(current, cell):
-                cell.is_solution = True  # Çözüm yolunun bir parçası olarak işaretle
-                cell.is_path = True      # Görünür path olarak da işaretle
                 solution_path.append(cell)  # Çözüm yoluna ekle
                 current = cell  # İlerlemeye devam et
                 
@@ -237,11 +418,23 @@ class WallFollower(MazeSolvingAlgorithm):
                     break
         
         # Başlangıç noktasını da çözüm yoluna ekle
-        self.start_cell.is_solution = True
-        self.start_cell.is_path = True
+        self.solution_cells = {cell.index for cell in solution_path}
+        self.solution_cells.add(self.start_cell.index)
+        for index in self.solution_cells:
+            self.mark_dirty(index)
         
         # Yol uzunluğunu hesapla
         self.path_length = len(solution_path) - 1  # Start ve end arasındaki hücre sayısı
+    
+    def get_solution_path(self):
+        """Duvar takibinin çıkardığı çözüm yolunu başlangıçtan bitişe döndür."""
+        if not self.solution_found:
+            return []
+        
+        path = list(reversed(self.solution_path))
+        if path[0] != self.start_cell:
+            path.insert(0, self.start_cell)
+        return path
         
     def are_neighbors(self, cell1, cell2):
         """İki hücrenin komşu olup olmadığını kontrol eder (aralarında duvar yoksa)."""
@@ -270,17 +463,20 @@ class Dijkstra(MazeSolvingAlgorithm):
         super().__init__(maze)
         self.name = "Dijkstra"
         self.priority_queue = []
-        self.visited = set()
+        self.distance = None  # Başlangıçtan her hücreye bilinen en kısa mesafe
+        self.settled = None  # Mesafesi kesinleşmiş hücreler
     
     def initialize(self):
         super().initialize()
         
-        # Başlangıç hücresini kuyruğa ekle (öncelik, hücre)
-        self.start_cell.distance = 0
-        self.priority_queue = []  # Kuyruğu temizle
-        # Başlangıç hücresini kuyruğa ekle ve ID ekleyerek benzersiz sıralama sağla
-        heapq.heappush(self.priority_queue, (0, id(self.start_cell), self.start_cell))  
-        self.visited = set()
+        start = self.start_cell.index
+        self.distance = np.full(self.maze.size, INF_DISTANCE, dtype=np.int32)
+        self.distance[start] = 0
+        self.settled = np.zeros(self.maze.size, dtype=bool)
+        
+        # Başlangıç hücresini kuyruğa ekle (mesafe, hücre indeksi)
+        self.priority_queue = [(0, start)]
+        self.metrics.pushes = 1
     
     def step(self):
         if super().step():
@@ -291,10 +487,12 @@ class Dijkstra(MazeSolvingAlgorithm):
             return True
         
         # En düşük maliyetli hücreyi kuyruğun başından al
-        current_distance, _, current = heapq.heappop(self.priority_queue)
+        current_distance, current = heapq.heappop(self.priority_queue)
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
         
         # Hedef hücreye ulaşıldı mı kontrol et
-        if current == self.end_cell:
+        if current == self.end_cell.index:
             self.solution_found = True
             self._is_finished = True
             self.elapsed_time = time.time() - self.start_time
@@ -302,123 +500,194 @@ class Dijkstra(MazeSolvingAlgorithm):
             return True
             
         # Zaten ziyaret edilmişse adımı atla
-        if current in self.visited:
+        if self.settled[current]:
             return False
         
-        # Hücreyi ziyaret et
-        self.visited.add(current)
-        self.mark_visited(current)
-        self.current_cell = current
+        # Hücreyi kesinleştir
+        self.settled[current] = True
         
-        # Komşulara bak - sadece duvarsız bağlantıları kontrol et
-        for neighbor in current.get_neighbors(self.maze.grid, include_walls=False):
-            if neighbor not in self.visited:
-                # Yeni mesafeyi hesapla (her adım 1 birim)
-                new_distance = current_distance + 1
-                
-                # Daha iyi bir yol bulduysa güncelle
-                if new_distance < neighbor.distance:
-                    neighbor.distance = new_distance
-                    neighbor.parent = current
-                    # ID ile benzersiz sıralama sağla
-                    heapq.heappush(self.priority_queue, (new_distance, id(neighbor), neighbor))
+        # Yeni mesafeyi hesapla (her adım 1 birim)
+        new_distance = current_distance + 1
         
+        # Komşulara bak - sadece duvarsız bağlantıları kontrol et
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            # Daha iyi bir yol bulduysa güncelle
+            if not self.settled[neighbor] and new_distance < self.distance[neighbor]:
+                self.distance[neighbor] = new_distance
+                self.parent[neighbor] = current
+                self.mark_visited(neighbor)
+                heapq.heappush(self.priority_queue, (new_distance, neighbor))
+                self.metrics.pushes += 1
+        
+        self.expanded(current, len(self.priority_queue))
         return False
 
 class DeadEndFilling(MazeSolvingAlgorithm):
-    """Çıkmaz Sokak Doldurma Algoritması."""
+    """Çıkmaz Sokak Doldurma Algoritması.
+    
+    degree her hücrenin doldurulmamış komşu sayısını tutar. Tek çıkışlı
+    (başlangıç ve bitiş dışındaki) hücreler kuyruğa girer; bir hücre
+    doldurulunca komşusunun derecesi düşer ve o da çıkmaz sokak olduysa
+    kuyruğa eklenir. Böylece koridorlar sonuna kadar O(hücre) sürede dolar.
+    Kuyruk boşalınca doldurulmamış hücreler çözümdür; yol, sadece bu
+    hücreler üzerinde yürünerek okunur.
+    """
     
     def __init__(self, maze):
         super().__init__(maze)
         self.name = "Çıkmaz Doldurma"
-        self.dead_ends = []
-        self.current_index = 0
+        self.degree = None  # Doldurulmamış komşu sayısı
+        self.filled = None  # Doldurulan hücrelerin bit haritası
+        self.keep = None  # Hiç doldurulmayacak hücreler (başlangıç ve bitiş)
+        self.queue = deque()
     
     def initialize(self):
         super().initialize()
         
-        # Çıkmaz sokakları bul
-        self.dead_ends = []
-        for row in self.maze.grid:
-            for cell in row:
-                # Başlangıç ve bitiş hücresini atla
-                if cell == self.start_cell or cell == self.end_cell:
-                    continue
-                
-                # Tek bir çıkışı olan hücreler çıkmaz sokaktır
-                # Sadece duvarsız bağlantıları kontrol et
-                neighbors = cell.get_neighbors(self.maze.grid, include_walls=False)
-                if len(neighbors) == 1:
-                    self.dead_ends.append(cell)
+        size = self.maze.size
+        self.degree = self.adjacency.degrees().astype(np.int32)
+        self.filled = np.zeros(size, dtype=bool)
+        self.keep = np.zeros(size, dtype=bool)
+        self.keep[[self.start_cell.index, self.end_cell.index]] = True
         
-        self.current_index = 0
+        # Başlangıçtaki çıkmaz sokaklar (bağlantısız hücreler dahil)
+        dead_ends = np.flatnonzero((self.degree <= 1) & ~self.keep)
+        self.queue = deque(dead_ends.tolist())
+        self.metrics.pushes = len(self.queue)
     
     def step(self):
         if super().step():
             return True
         
-        if self.current_index >= len(self.dead_ends):
-            print(f"Çıkmaz Doldurma: {len(self.dead_ends)} adet çıkmaz sokak dolduruldu.")
-            # Tüm çıkmaz sokaklar işlendi, şimdi başlangıçtan bitişe DFS ile yol bul
-            dfs = DFS(self.maze)
-            dfs.initialize()
-            
-            # DFS algoritmasını tamamen çalıştır
-            dfs_step_count = 0
-            max_steps = self.maze.rows * self.maze.cols * 4  # Maximum adım sayısı sınırı
-            
-            while not dfs._is_finished and dfs_step_count < max_steps:
-                dfs.step()
-                dfs_step_count += 1
-            
-            # DFS'den çözüm yolunu al
-            if dfs.solution_found:
-                # Çözüm bulunduğunda, çözüm verilerini kopyala
-                self.solution_found = True
-                self.path_length = dfs.path_length
-                self.visited_count = dfs.visited_count + self.visited_count
-                
-                # Hücreleri doğrudan bizim algoritma sonucu olarak işaretle
-                for row in self.maze.grid:
-                    for cell in row:
-                        # Önce tüm ziyaret işaretlemelerini kaldır
-                        cell.is_path = False
-                        
-                # Sadece çözüm yolundaki hücreleri işaretle
-                current = self.maze.end_cell
-                while current and current != self.maze.start_cell:
-                    current.is_solution = True
-                    current.is_path = True
-                    current = current.parent
-                
-                # Başlangıç noktasını da işaretle
-                if self.maze.start_cell:
-                    self.maze.start_cell.is_solution = True
-                    self.maze.start_cell.is_path = True
-                
-                print(f"Çıkmaz Doldurma: DFS ile çözüm bulundu. Yol uzunluğu: {self.path_length}")
-            else:
-                print("Çıkmaz Doldurma: DFS ile çözüm bulunamadı!")
-            
-            self._is_finished = True
-            self.elapsed_time = time.time() - self.start_time
-            return True
+        if not self.queue:
+            return self.read_solution()
         
-        # Çıkmaz sokakları doldur - her adımda bir çıkmaz sokağı işaretle
-        current_dead_end = self.dead_ends[self.current_index]
-        self.current_cell = current_dead_end
-        self.mark_visited(current_dead_end)
+        current = self.queue.popleft()
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
+        self.fill(current)
         
-        # Bu hücreden tek çıkışı bul ve önceki olarak ayarla
-        # Sadece duvarsız bağlantıları kontrol et
-        neighbors = current_dead_end.get_neighbors(self.maze.grid, include_walls=False)
-        if neighbors:
-            current_dead_end.parent = neighbors[0]
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if self.filled[neighbor]:
+                continue
+            self.degree[neighbor] -= 1
+            if self.degree[neighbor] == 1 and not self.keep[neighbor]:
+                self.queue.append(neighbor)
+                self.metrics.pushes += 1
         
-        # Bir sonraki çıkmaz sokağa geç
-        self.current_index += 1
+        self.expanded(current, len(self.queue))
+        return False
+    
+    def fill(self, index):
+        """Hücreyi doldurulmuş olarak işaretle (çizimde ziyaret edilmiş görünür)."""
+        self.filled[index] = True
+        self.mark_visited(index)
+    
+    def read_solution(self):
+        """Doldurulmamış hücreler üzerinde başlangıçtan bitişe yolu oku.
+        
+        Mükemmel labirentte geriye sadece çözüm yolu kalır; döngülü
+        labirentte kalan halkalar arasından en kısa yol seçilir.
+        """
+        filled_count = int(np.count_nonzero(self.filled))
+        self.log(f"Çıkmaz Doldurma: {filled_count} hücre dolduruldu.")
+        
+        start, end = self.start_cell.index, self.end_cell.index
+        reached = self.filled.copy()
+        reached[start] = True
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            if current == end:
+                self.solution_found = True
+                break
+            for neighbor in self.adjacency.neighbors(current).tolist():
+                if not reached[neighbor]:
+                    reached[neighbor] = True
+                    self.parent[neighbor] = current
+                    queue.append(neighbor)
+        
+        self._is_finished = True
+        self.elapsed_time = time.time() - self.start_time
+        if self.solution_found:
+            self.reconstruct_path()
+            self.log(f"Çıkmaz Doldurma: Çözüm bulundu. Yol uzunluğu: {self.path_length}")
+        else:
+            self.log("Çıkmaz Doldurma: Çözüm bulunamadı!")
+        return True
+
+class BatchDeadEndFilling(DeadEndFilling):
+    """Çıkmaz sokak doldurmanın vektörel, toplu çalışan sürümü (penceresiz çalıştırma için).
+    
+    Her adımda o anki tüm çıkmaz sokaklar (bir dalga) NumPy ile birlikte
+    doldurulur; adım sayısı hücre sayısı yerine en uzun çıkmaz dalın
+    derinliği kadardır. Sayaçlar tek tek doldurmayla aynı anlamdadır.
+    bfs_level'deki gibi SMALL_FRONTIER'dan küçük dalgalar düz Python ile işlenir.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.name = "Çıkmaz Doldurma (Toplu)"
+        self.wave = np.zeros(0, dtype=np.int64)
+    
+    def initialize(self):
+        super().initialize()
+        self.wave = np.array(self.queue, dtype=np.int64)
+        self.queue = deque()
+        self.metrics.max_frontier = len(self.wave)
+    
+    def step(self):
+        if MazeSolvingAlgorithm.step(self):
+            return True
         
+        wave = self.wave
+        if not len(wave):
+            return self.read_solution()
+        
+        metrics = self.metrics
+        metrics.pops += len(wave)
+        self.current_cell = self.maze.cell_at(wave[-1])
+        self.filled[wave] = True
+        self.mark_visited_many(wave)
+        
+        # Dalganın doldurulmamış komşularının derecesini düşür; tek çıkışı kalanlar sonraki dalgadır
+        if len(wave) < SMALL_FRONTIER:
+            self.wave = self.next_wave_scalar(wave)
+        else:
+            neighbors = self.wave_neighbors(wave)
+            neighbors = neighbors[~self.filled[neighbors]]
+            np.subtract.at(self.degree, neighbors, 1)
+            candidates = np.unique(neighbors)
+            self.wave = candidates[(self.degree[candidates] <= 1) & ~self.keep[candidates]]
+        
+        metrics.pushes += len(self.wave)
+        metrics.expansions += len(wave)
+        metrics.max_frontier = max(metrics.max_frontier, len(self.wave))
+        if self.on_expand is not None:
+            for index in wave.tolist():
+                self.on_expand(self, index)
         return False
+    
+    def next_wave_scalar(self, wave):
+        """Küçük bir dalga için sonraki dalgayı hücre hücre hesapla."""
+        degree, filled, keep = self.degree, self.filled, self.keep
+        following = []
+        for current in wave.tolist():
+            for neighbor in self.adjacency.neighbors(current).tolist():
+                if filled[neighbor]:
+                    continue
+                degree[neighbor] -= 1
+                if degree[neighbor] == 1 and not keep[neighbor]:
+                    following.append(neighbor)
+        return np.array(following, dtype=np.int64)
+    
+    def wave_neighbors(self, cells):
+        """Verilen hücrelerin tüm duvarsız komşuları (CSR aralıkları tek seferde toplanır)."""
+        offsets = self.adjacency.offsets
+        starts = offsets[cells]
+        counts = offsets[cells + 1] - starts
+        positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return self.adjacency.targets[positions]
 
 class BFS(MazeSolvingAlgorithm):
     """Genişlik Öncelikli Arama Algoritması."""
@@ -431,12 +700,9 @@ class BFS(MazeSolvingAlgorithm):
     def initialize(self):
         super().initialize()
         
-        # Kuyruğu temizle
-        self.queue = deque()
-        # Başlangıç hücresini kuyruğa ekle
-        self.queue.append(self.start_cell)
-        self.visited_cells = set([self.start_cell])
-        self.start_cell.visited = True
+        # Kuyruğu temizle ve başlangıç hücresini kuyruğa ekle
+        self.queue = deque([self.start_cell.index])
+        self.metrics.pushes = 1
     
     def step(self):
         if super().step():
@@ -448,10 +714,11 @@ class BFS(MazeSolvingAlgorithm):
         
         # Kuyruktan bir hücre al
         current = self.queue.popleft()
-        self.current_cell = current
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
         
         # Hedef hücreye ulaşıldı mı kontrol et
-        if current == self.end_cell:
+        if current == self.end_cell.index:
             self.solution_found = True
             self._is_finished = True
             self.elapsed_time = time.time() - self.start_time
@@ -459,15 +726,74 @@ class BFS(MazeSolvingAlgorithm):
             return True
         
         # Komşulara bak - sadece duvarsız bağlantıları kontrol et
-        for neighbor in current.get_neighbors(self.maze.grid, include_walls=False):
-            if neighbor not in self.visited_cells:
-                neighbor.visited = True
-                neighbor.is_path = True
-                neighbor.parent = current
-                self.visited_cells.add(neighbor)
-                self.visited_count += 1
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if not self.visited[neighbor]:
+                self.parent[neighbor] = current
+                self.mark_visited(neighbor)
                 self.queue.append(neighbor)
+                self.metrics.pushes += 1
         
+        self.expanded(current, len(self.queue))
+        return False
+
+class BatchBFS(MazeSolvingAlgorithm):
+    """Seviye eşzamanlı, vektörel Genişlik Öncelikli Arama (penceresiz çalıştırma için).
+    
+    Her adımda sınırın tamamı maze.bfs_level ile NumPy üzerinden genişletilir;
+    adım sayısı hücre sayısı yerine seviye sayısı kadardır. Bitişin
+    bulunduğu seviyenin sonunda durur. Tüm labirentin mesafe alanı için
+    Maze.compute_distance_field kullanılır.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.name = "BFS (Toplu)"
+        self.distance = None
+        self.frontier = np.zeros(0, dtype=np.int32)
+        self.depth = 0
+    
+    def initialize(self):
+        super().initialize()
+        
+        start = self.start_cell.index
+        self.distance = np.full(self.maze.size, INF_DISTANCE, dtype=np.int32)
+        self.distance[start] = 0
+        self.frontier = np.array([start], dtype=np.int32)
+        self.depth = 0
+        self.metrics.pushes = 1
+        self.metrics.max_frontier = 1
+    
+    def step(self):
+        if super().step():
+            return True
+        
+        frontier = self.frontier
+        if not len(frontier):
+            self._is_finished = True
+            return True
+        
+        self.depth += 1
+        following = bfs_level(self.adjacency.table, frontier, self.distance, self.parent, self.depth)
+        self.mark_visited_many(following)
+        self.frontier = following
+        self.current_cell = self.maze.cell_at(frontier[-1])
+        
+        metrics = self.metrics
+        metrics.pops += len(frontier)
+        metrics.expansions += len(frontier)
+        metrics.pushes += len(following)
+        metrics.max_frontier = max(metrics.max_frontier, len(following))
+        if self.on_expand is not None:
+            for index in frontier.tolist():
+                self.on_expand(self, index)
+        
+        # Bitiş bu seviyede bulunduysa yol ebeveyn dizisinde hazırdır
+        if self.distance[self.end_cell.index] != INF_DISTANCE:
+            self.solution_found = True
+            self._is_finished = True
+            self.elapsed_time = time.time() - self.start_time
+            self.reconstruct_path()
+            return True
         return False
 
 class DFS(MazeSolvingAlgorithm):
@@ -481,12 +807,9 @@ class DFS(MazeSolvingAlgorithm):
     def initialize(self):
         super().initialize()
         
-        # Yığını temizle
-        self.stack = []
-        # Başlangıç hücresini yığına ekle
-        self.stack.append(self.start_cell)
-        self.visited_cells = set([self.start_cell])
-        self.start_cell.visited = True
+        # Yığını temizle ve başlangıç hücresini yığına ekle
+        self.stack = [self.start_cell.index]
+        self.metrics.pushes = 1
     
     def step(self):
         if super().step():
@@ -498,10 +821,11 @@ class DFS(MazeSolvingAlgorithm):
         
         # Yığından bir hücre al
         current = self.stack.pop()
-        self.current_cell = current
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
         
         # Hedef hücreye ulaşıldı mı kontrol et
-        if current == self.end_cell:
+        if current == self.end_cell.index:
             self.solution_found = True
             self._is_finished = True
             self.elapsed_time = time.time() - self.start_time
@@ -509,97 +833,170 @@ class DFS(MazeSolvingAlgorithm):
             return True
         
         # Komşulara bak - sadece duvarsız bağlantıları kontrol et
-        for neighbor in current.get_neighbors(self.maze.grid, include_walls=False):
-            if neighbor not in self.visited_cells:
-                neighbor.visited = True
-                neighbor.is_path = True
-                neighbor.parent = current
-                self.visited_cells.add(neighbor)
-                self.visited_count += 1
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if not self.visited[neighbor]:
+                self.parent[neighbor] = current
+                self.mark_visited(neighbor)
                 self.stack.append(neighbor)
+                self.metrics.pushes += 1
         
+        self.expanded(current, len(self.stack))
         return False
 
 class IDS(MazeSolvingAlgorithm):
-    """Yinelemeli Derinleştirme Arama Algoritması."""
+    """Yinelemeli Derinleştirme Arama Algoritması.
     
-    def __init__(self, maze):
+    Her iterasyon, sınırı aşmayan hücrelerde derinlik sınırlı bir DFS'dir.
+    İterasyon durumu (derinlik, bu iterasyonda görüldü mü) nesil damgalı
+    dizilerde tutulur: stamp[c] == generation değilse hücre bu iterasyonda
+    görülmemiştir, bu yüzden derinleştirmede hiçbir dizi sıfırlanmaz. Bir
+    hücreye daha sığ bir derinlikte yeniden ulaşılırsa derinliği düşürülüp
+    tekrar genişletilir; yığında kalan eski (daha derin) kayıtlar atlanır.
+    
+    schedule derinleştirme planıdır:
+      "linear":    sınır her iterasyonda 1 artar (klasik IDS)
+      "geometric": sınır her iterasyonda en az iki katına çıkar
+      "ida_star":  f = derinlik + Manhattan mesafesi; sınır, aşılan en küçük f'ye atlar (IDA*)
+    Sınır en kısa yol uzunluğunu aşabileceğinden bulunan yol ancak alt
+    sınıra eşitse hemen kabul edilir; değilse sınır daraltılıp iterasyon
+    tamamlanır. Böylece her planda bulunan yol en kısadır.
+    """
+    
+    SCHEDULES = ("linear", "geometric", "ida_star")
+    
+    def __init__(self, maze, schedule="geometric"):
         super().__init__(maze)
+        if schedule not in self.SCHEDULES:
+            raise ValueError(f"Bilinmeyen derinleştirme planı: {schedule}")
         self.name = "IDS"
-        self.max_depth = 0
+        self.schedule = schedule
+        self.max_depth = 0  # Bu iterasyonun sınırı (ida_star'da f sınırı)
+        self.lower_bound = 0  # En kısa yol bundan kısa olamaz
+        self.next_bound = INF_DISTANCE  # Bu iterasyonda sınırı aşan en küçük değer
         self.current_depth = 0
+        self.iterations = 0
         self.stack = []
-        self.depths = {}  # Her hücrenin derinliğini tut
+        self.generation = 0
+        self.stamp = None  # Hücrenin son görüldüğü iterasyon
+        self.depth = None  # Hücrenin bu iterasyondaki derinliği (stamp eşleşiyorsa geçerli)
+        self.best_path = None  # Bulunan en iyi yol (bitişten başlangıca, başlangıç hariç)
     
     def initialize(self):
         super().initialize()
         
-        # Başlangıç değerlerini ayarla
-        self.max_depth = 0
+        size = self.maze.size
+        self.stamp = np.zeros(size, dtype=np.int32)
+        self.depth = np.zeros(size, dtype=np.int32)
+        self.generation = 0
+        self.iterations = 0
+        self.best_path = None
         self.current_depth = 0
         
-        # Yığını temizle
-        self.stack = []
-        # Başlangıç hücresini yığına ekle
-        self.stack.append((self.start_cell, 0))  # (hücre, derinlik)
-        self.depths = {self.start_cell: 0}
-        self.start_cell.visited = True
+        bound = self.bound(self.start_cell.index, 0)
+        self.lower_bound = bound
+        self.start_iteration(bound)
+    
+    def heuristic(self, index):
+        """ida_star için Manhattan mesafesi, diğer planlarda 0."""
+        if self.schedule != "ida_star":
+            return 0
+        return manhattan(index, self.maze.cols, self.end_cell)
+    
+    def bound(self, index, depth):
+        """Sınırla karşılaştırılan değer (derinlik ya da f-skoru)."""
+        return depth + self.heuristic(index)
+    
+    def start_iteration(self, limit):
+        """Yeni sınırla aramayı başlangıçtan yeniden başlat (diziler sıfırlanmaz)."""
+        self.generation += 1
+        self.iterations += 1
+        self.max_depth = limit
+        self.next_bound = INF_DISTANCE
+        start = self.start_cell.index
+        self.stamp[start] = self.generation
+        self.depth[start] = 0
+        self.stack = [(start, 0)]  # (hücre indeksi, derinlik)
+        self.metrics.pushes += 1
+    
+    def next_limit(self):
+        """Plan göre sonraki iterasyonun sınırı (next_bound aşılan en küçük değerdir)."""
+        if self.schedule == "geometric":
+            return max(self.next_bound, 2 * self.max_depth)
+        return self.next_bound
     
     def step(self):
-        if super().step():
+        # Temel sınıfın current_cell == end_cell kontrolü kullanılmaz: bitişe ilk
+        # ulaşılan yol sınır daraltılırken daha kısa bir yolla değiştirilebilir
+        if self._is_finished:
             return True
         
         if not self.stack:
-            # Yığın boşsa, derinliği artır ve yeniden başla
-            self.max_depth += 1
-            
-            # Belli bir derinlikten sonra sonlandır
-            if self.max_depth > self.maze.rows * self.maze.cols:
-                self._is_finished = True
-                return True
-            
-            # Hücreleri sıfırla
-            for row in self.maze.grid:
-                for cell in row:
-                    cell.reset_path_data()
-            
-            # Başlangıç hücresini yığına ekle
-            self.stack = [(self.start_cell, 0)]
-            self.depths = {self.start_cell: 0}
-            self.visited_cells = set([self.start_cell])
-            self.start_cell.visited = True
-            return False
+            return self.finish_iteration()
         
         # Yığından bir hücre al
         current, depth = self.stack.pop()
-        self.current_cell = current
+        self.metrics.pops += 1
+        if depth != self.depth[current]:
+            # Hücreye sonradan daha sığ bir derinlikte ulaşıldı; bu kayıt eskidi
+            return False
+        self.current_cell = self.maze.cell_at(current)
         self.current_depth = depth
         
         # Hedef hücreye ulaşıldı mı kontrol et
-        if current == self.end_cell:
-            self.solution_found = True
+        if current == self.end_cell.index:
+            self.best_path = self.trace_path()
+            if depth <= self.lower_bound:
+                return self.finish()
+            # Daha kısa bir yol hâlâ mümkün: sadece ondan kısa yolları ara
+            self.max_depth = depth - 1
+            return False
+        
+        new_depth = depth + 1
+        generation = self.generation
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            seen = self.stamp[neighbor] == generation
+            if seen and new_depth >= self.depth[neighbor]:
+                continue
+            value = self.bound(neighbor, new_depth)
+            if value > self.max_depth:
+                if value < self.next_bound:
+                    self.next_bound = value
+                continue
+            self.stamp[neighbor] = generation
+            self.depth[neighbor] = new_depth
+            self.parent[neighbor] = current
+            self.mark_visited(neighbor)
+            self.stack.append((neighbor, new_depth))
+            self.metrics.pushes += 1
+        
+        self.expanded(current, len(self.stack))
+        return False
+    
+    def finish_iteration(self):
+        """Yığın boşaldı: ya bulunan yolu kabul et ya da sınırı genişlet."""
+        if self.best_path is not None:
+            return self.finish()
+        if self.next_bound == INF_DISTANCE:
+            # Hiçbir hücre sınır yüzünden budanmadı: bitişe ulaşılamaz
             self._is_finished = True
             self.elapsed_time = time.time() - self.start_time
-            self.reconstruct_path()
             return True
         
-        # Eğer mevcut derinlik maksimum derinlikten küçükse komşulara bak
-        if depth < self.max_depth:
-            # Sadece duvarsız bağlantıları kontrol et
-            for neighbor in current.get_neighbors(self.maze.grid, include_walls=False):
-                new_depth = depth + 1
-                
-                # Daha önce ziyaret edilmemiş veya daha düşük derinlikte ziyaret edilmiş ise
-                if neighbor not in self.visited_cells or new_depth < self.depths.get(neighbor, float('inf')):
-                    neighbor.visited = True
-                    neighbor.is_path = True
-                    neighbor.parent = current
-                    self.visited_cells.add(neighbor)
-                    self.visited_count += 1
-                    self.depths[neighbor] = new_depth
-                    self.stack.append((neighbor, new_depth))
-        
+        self.lower_bound = self.next_bound
+        self.start_iteration(self.next_limit())
+        self.log(f"IDS: Sınır {self.max_depth} ile {self.iterations}. iterasyon")
         return False
+    
+    def finish(self):
+        """En iyi yolu ebeveyn dizisine yaz ve çözümü işaretle."""
+        path = self.best_path
+        for child, parent in zip(path, path[1:] + [self.start_cell.index]):
+            self.parent[child] = parent
+        self.solution_found = True
+        self._is_finished = True
+        self.elapsed_time = time.time() - self.start_time
+        self.reconstruct_path()
+        return True
 
 class AStar(MazeSolvingAlgorithm):
     """A* Arama Algoritması."""
@@ -607,30 +1004,29 @@ class AStar(MazeSolvingAlgorithm):
     def __init__(self, maze):
         super().__init__(maze)
         self.name = "A*"
-        self.open_set = []
-        self.closed_set = set()
-        self.g_score = {}  # Başlangıçtan bir hücreye en kısa yol maliyeti
-        self.f_score = {}  # g_score + heuristic (tahmin edilen maliyet)
+        self.open_set = IndexedHeap()
+        self.closed = None  # Kapalı küme bit haritası (hücre indeksine göre)
+        self.g_score = None  # Başlangıçtan bir hücreye en kısa yol maliyeti
     
     def initialize(self):
         super().initialize()
         
         # Başlangıç hücresini açık sete ekle
-        self.start_cell.distance = 0
-        self.g_score = {self.start_cell: 0}
+        self.g_score = np.full(self.maze.size, INF_DISTANCE, dtype=np.int32)
+        self.closed = np.zeros(self.maze.size, dtype=bool)
         
-        # Manhattan mesafesini kullanarak f-skoru hesapla
-        start_heuristic = self.heuristic(self.start_cell)
-        self.f_score = {self.start_cell: start_heuristic}
+        start = self.start_cell.index
+        self.g_score[start] = 0
         
-        # Açık seti temizle
-        self.open_set = []
-        heapq.heappush(self.open_set, (self.f_score[self.start_cell], 0, self.start_cell))  # (f_score, tie_breaker, cell)
-        self.closed_set = set()
+        # Manhattan mesafesini kullanarak f-skoru hesapla
+        start_heuristic = self.index_heuristic(start)
+        self.open_set = IndexedHeap()
+        self.open_set.push(start, (start_heuristic, start_heuristic, start))  # (f_score, h, hücre)
+        self.metrics.pushes = 1
     
-    def heuristic(self, cell):
-        """Manhattan mesafesi hesapla."""
-        return abs(cell.row - self.end_cell.row) + abs(cell.col - self.end_cell.col)
+    def index_heuristic(self, index):
+        """Hücre indeksinden bitişe Manhattan mesafesi."""
+        return manhattan(index, self.maze.cols, self.end_cell)
     
     def step(self):
         if super().step():
@@ -641,11 +1037,12 @@ class AStar(MazeSolvingAlgorithm):
             return True
         
         # En düşük f-skora sahip hücreyi al
-        _, _, current = heapq.heappop(self.open_set)
-        self.current_cell = current
+        current, _ = self.open_set.pop()
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
         
         # Hedef hücreye ulaşıldı mı kontrol et
-        if current == self.end_cell:
+        if current == self.end_cell.index:
             self.solution_found = True
             self._is_finished = True
             self.elapsed_time = time.time() - self.start_time
@@ -653,52 +1050,598 @@ class AStar(MazeSolvingAlgorithm):
             return True
         
         # Kapalı sete ekle
-        self.closed_set.add(current)
-        self.mark_visited(current)
+        self.closed[current] = True
+        
+        # Komşuya gitmek için tentative_g_score hesapla - her adım 1 birim
+        tentative_g_score = int(self.g_score[current]) + 1
         
         # Komşulara bak - sadece duvarsız bağlantıları kontrol et
-        for neighbor in current.get_neighbors(self.maze.grid, include_walls=False):
-            if neighbor in self.closed_set:
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if self.closed[neighbor]:
                 continue
             
-            # Komşuya gitmek için tentative_g_score hesapla
-            tentative_g_score = self.g_score[current] + 1  # Her adım 1 birim
-            
             # Komşu açık sette değilse veya daha iyi bir g-skor bulduysa
-            if neighbor not in self.g_score or tentative_g_score < self.g_score[neighbor]:
+            if tentative_g_score < self.g_score[neighbor]:
                 # Bu yol en iyiyse, kaydediyoruz
-                neighbor.parent = current
+                self.parent[neighbor] = current
                 self.g_score[neighbor] = tentative_g_score
-                f_score = tentative_g_score + self.heuristic(neighbor)
-                self.f_score[neighbor] = f_score
-                
-                # Eşitlik durumunda rastgele sıralama için tie_breaker
-                tie_breaker = random.random()
+                self.mark_visited(neighbor)
+                h = self.index_heuristic(neighbor)
                 
-                # Açık sete ekle
-                if neighbor not in [cell for _, _, cell in self.open_set]:
-                    heapq.heappush(self.open_set, (f_score, tie_breaker, neighbor))
+                # Eşitlikte hedefe daha yakın (h'si küçük) hücre, sonra küçük indeks öne geçer
+                # (decrease-key de bir ekleme olarak sayılır)
+                self.open_set.push(neighbor, (tentative_g_score + h, h, neighbor))
+                self.metrics.pushes += 1
+        
+        self.expanded(current, len(self.open_set))
+        return False
+
+class CorridorJump(MazeSolvingAlgorithm):
+    """Koridor atlamalı A* (Jump Point Search benzeri).
+    
+    Sadece atlama noktaları (kavşaklar, başlangıç ve bitiş) açık kümeye
+    girer. Bir atlama noktası genişletilirken her çıkışındaki koridor, iki
+    bağlantılı hücreler boyunca bir sonraki atlama noktasına kadar tek
+    seferde yürünür; kenar maliyeti koridor uzunluğudur. Bitişe çıkmayan
+    çıkmaz sokaklar sıraya alınmaz. Genişletme sayısı böylece hücre sayısıyla
+    değil kavşak sayısıyla ölçeklenir.
+    
+    jump_parent bir atlama noktasının önceki atlama noktasını, entry ise
+    o noktadan çıkılan koridorun ilk hücresini tutar; çözüm bulununca
+    koridorlar yeniden yürünerek parent dizisi hücre hücre doldurulur.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.name = "Koridor Atlama"
+        self.open_set = IndexedHeap()
+        self.closed = None
+        self.g_score = None
+        self.jump_parent = None
+        self.entry = None
+        self.degrees = None
+    
+    def initialize(self):
+        super().initialize()
+        
+        size = self.maze.size
+        start = self.start_cell.index
+        self.degrees = self.adjacency.degrees()
+        self.g_score = np.full(size, INF_DISTANCE, dtype=np.int32)
+        self.closed = np.zeros(size, dtype=bool)
+        self.jump_parent = np.full(size, NO_PARENT, dtype=np.int32)
+        self.entry = np.full(size, NO_PARENT, dtype=np.int32)
+        self.g_score[start] = 0
+        
+        h = self.index_heuristic(start)
+        self.open_set = IndexedHeap()
+        self.open_set.push(start, (h, h, start))  # (f_score, h, hücre)
+        self.metrics.pushes = 1
+    
+    index_heuristic = AStar.index_heuristic
+    
+    def is_jump_point(self, index):
+        """Koridorun bittiği hücre: kavşak, çıkmaz sokak, başlangıç ya da bitiş."""
+        return self.degrees[index] != 2 or index == self.start_cell.index or index == self.end_cell.index
+    
+    def next_in_corridor(self, index, previous):
+        """İki bağlantılı bir hücrenin, geldiğimiz hücre dışındaki komşusu."""
+        first = self.adjacency.offsets[index]
+        neighbor = int(self.adjacency.targets[first])
+        if neighbor == previous:
+            neighbor = int(self.adjacency.targets[first + 1])
+        return neighbor
+    
+    def jump(self, origin, first):
+        """origin'den first yönündeki koridoru yürü; (atlama noktası, uzunluk) döndür."""
+        previous, cell, length = origin, first, 1
+        while not self.is_jump_point(cell):
+            self.mark_visited(cell)
+            previous, cell = cell, self.next_in_corridor(cell, previous)
+            length += 1
+        return cell, length
+    
+    def step(self):
+        if super().step():
+            return True
         
+        if not self.open_set:
+            self._is_finished = True
+            return True
+        
+        current, _ = self.open_set.pop()
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
+        
+        # Hedef hücreye ulaşıldı mı kontrol et
+        if current == self.end_cell.index:
+            self.solution_found = True
+            self._is_finished = True
+            self.elapsed_time = time.time() - self.start_time
+            self.fill_corridors()
+            self.reconstruct_path()
+            return True
+        
+        self.closed[current] = True
+        g_current = int(self.g_score[current])
+        end = self.end_cell.index
+        
+        for first in self.adjacency.neighbors(current).tolist():
+            jump_point, length = self.jump(current, first)
+            if self.closed[jump_point]:
+                continue
+            self.mark_visited(jump_point)
+            # Bitiş değilse çıkmaz sokaktan bir yere gidilemez
+            if self.degrees[jump_point] == 1 and jump_point != end:
+                continue
+            
+            tentative_g_score = g_current + length
+            if tentative_g_score < self.g_score[jump_point]:
+                self.g_score[jump_point] = tentative_g_score
+                self.jump_parent[jump_point] = current
+                self.entry[jump_point] = first
+                h = self.index_heuristic(jump_point)
+                self.open_set.push(jump_point, (tentative_g_score + h, h, jump_point))
+                self.metrics.pushes += 1
+        
+        self.expanded(current, len(self.open_set))
         return False
+    
+    def fill_corridors(self):
+        """Çözüm zincirindeki koridorları yeniden yürüyerek parent dizisini doldur."""
+        start = self.start_cell.index
+        target = self.end_cell.index
+        while target != start:
+            origin = int(self.jump_parent[target])
+            previous, cell = origin, int(self.entry[target])
+            self.parent[cell] = origin
+            while cell != target:
+                previous, cell = cell, self.next_in_corridor(cell, previous)
+                self.parent[cell] = previous
+            target = origin
 
-def create_algorithm(algo_name, maze=None):
-    """Algoritma adına göre uygun algoritmayı oluştur."""
+class BidirectionalSearch(MazeSolvingAlgorithm, ABC):
+    """Başlangıçtan ve bitişten aynı anda arayan çözücülerin ortak kısmı.
+    
+    İleri arama parent/visited, geri arama parent_back/backward_visited
+    dizilerini kullanır (visited iki aramanın birleşimidir). Her adımda sınırı
+    küçük olan taraf bir hücre genişletir. Bir hücreye iki taraf da ulaştığında
+    aday yol uzunluğu best_length ile karşılaştırılır; alt sınır best_length'e
+    ulaşınca arama durur ve iki ebeveyn zinciri buluşma hücresinde birleştirilir.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.parent_back = None
+        self.best_length = INF_DISTANCE  # Şu ana kadar bulunan en kısa yolun uzunluğu
+        self.meeting_cell = NO_PARENT  # Bu yolun iki aramanın buluştuğu hücresi
+    
+    def initialize(self):
+        super().initialize()
+        
+        end = self.end_cell.index
+        self.parent_back = np.full(self.maze.size, NO_PARENT, dtype=np.int32)
+        self.backward_visited = np.zeros(self.maze.size, dtype=bool)
+        self.backward_visited[end] = True
+        self.mark_visited(end)
+        
+        self.best_length = INF_DISTANCE
+        self.meeting_cell = NO_PARENT
+        if end == self.start_cell.index:
+            self.meet(end, 0)
+    
+    def discover(self, index, backward):
+        """Hücreyi ileri ya da geri aramada ulaşılmış olarak işaretle."""
+        if backward:
+            self.backward_visited[index] = True
+            self.mark_dirty(index)
+        self.mark_visited(index)
+    
+    def meet(self, index, length):
+        """İki aramanın ulaştığı hücreden geçen yol daha kısaysa kaydet."""
+        if length < self.best_length:
+            self.best_length = length
+            self.meeting_cell = index
+    
+    def finish(self):
+        """Aramayı bitir; buluşma varsa çözüm yolunu oluştur."""
+        self._is_finished = True
+        self.elapsed_time = time.time() - self.start_time
+        if self.meeting_cell != NO_PARENT:
+            self.solution_found = True
+            self.join_paths()
+            self.reconstruct_path()
+            self.log(f"{self.name}: Aramalar buluştu, yol uzunluğu {self.best_length}")
+        return True
+    
+    def join_paths(self):
+        """Geri zinciri ileri ebeveyn dizisine aktar; çözüm bitişten başlangıca izlenebilsin."""
+        parent_back = self.parent_back
+        end = self.end_cell.index
+        current = self.meeting_cell
+        while current != end:
+            following = int(parent_back[current])
+            self.parent[following] = current
+            current = following
+    
+    def step(self):
+        if self._is_finished:
+            return True
+        if self.should_stop():
+            return self.finish()
+        self.expand_side(self.choose_backward())
+        return False
+    
+    @abstractmethod
+    def should_stop(self):
+        """Daha kısa bir yol bulunamayacağı kesinleştiyse True."""
+    
+    @abstractmethod
+    def choose_backward(self):
+        """Bu adımda geri aramanın genişletilip genişletilmeyeceği."""
+    
+    @abstractmethod
+    def expand_side(self, backward):
+        """Seçilen taraftan bir hücre genişlet."""
+
+class BidirectionalBFS(BidirectionalSearch):
+    """Çift Yönlü Genişlik Öncelikli Arama.
+    
+    Kuyruklar mesafeye göre sıralı olduğundan önlerindeki hücrelerin
+    mesafeleri toplamı, henüz bulunmamış her yol için bir alt sınırdır;
+    bu toplam best_length'e ulaşınca bulunan yol en kısadır.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.name = "Çift Yönlü BFS"
+        self.queue_forward = deque()
+        self.queue_backward = deque()
+        self.distance_forward = None
+        self.distance_backward = None
+    
+    def initialize(self):
+        super().initialize()
+        
+        start, end = self.start_cell.index, self.end_cell.index
+        self.distance_forward = np.full(self.maze.size, INF_DISTANCE, dtype=np.int32)
+        self.distance_backward = np.full(self.maze.size, INF_DISTANCE, dtype=np.int32)
+        self.distance_forward[start] = 0
+        self.distance_backward[end] = 0
+        self.queue_forward = deque([start])
+        self.queue_backward = deque([end])
+        self.metrics.pushes = 2
+    
+    def should_stop(self):
+        if not self.queue_forward or not self.queue_backward:
+            # Bir taraf tükendi: buluşma yoksa bitişe ulaşılamaz
+            return True
+        if self.meeting_cell == NO_PARENT:
+            return False
+        lower_bound = (int(self.distance_forward[self.queue_forward[0]])
+                       + int(self.distance_backward[self.queue_backward[0]]))
+        return lower_bound >= self.best_length
+    
+    def choose_backward(self):
+        return len(self.queue_backward) < len(self.queue_forward)
+    
+    def expand_side(self, backward):
+        if backward:
+            queue, parent = self.queue_backward, self.parent_back
+            distance, other_distance = self.distance_backward, self.distance_forward
+        else:
+            queue, parent = self.queue_forward, self.parent
+            distance, other_distance = self.distance_forward, self.distance_backward
+        
+        current = queue.popleft()
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
+        next_distance = int(distance[current]) + 1
+        
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if distance[neighbor] != INF_DISTANCE:
+                continue
+            distance[neighbor] = next_distance
+            parent[neighbor] = current
+            self.discover(neighbor, backward)
+            queue.append(neighbor)
+            self.metrics.pushes += 1
+            # Diğer arama da bu hücreye ulaştıysa iki yarım yol birleşir
+            if other_distance[neighbor] != INF_DISTANCE:
+                self.meet(neighbor, next_distance + int(other_distance[neighbor]))
+        
+        self.expanded(current, len(self.queue_forward) + len(self.queue_backward))
+
+class BidirectionalAStar(BidirectionalSearch):
+    """Çift Yönlü A* Arama.
+    
+    İleri arama bitişe, geri arama başlangıca olan Manhattan mesafesini
+    sezgi olarak kullanır. Sezgi tutarlı olduğundan açık kümelerden
+    herhangi birinin en küçük f-skoru best_length'e ulaşınca bulunan yol
+    en kısadır.
+    """
+    
+    def __init__(self, maze):
+        super().__init__(maze)
+        self.name = "Çift Yönlü A*"
+        self.open_forward = IndexedHeap()
+        self.open_backward = IndexedHeap()
+        self.g_forward = None
+        self.g_backward = None
+        self.closed_forward = None
+        self.closed_backward = None
+    
+    def initialize(self):
+        super().initialize()
+        
+        size = self.maze.size
+        start, end = self.start_cell.index, self.end_cell.index
+        self.g_forward = np.full(size, INF_DISTANCE, dtype=np.int32)
+        self.g_backward = np.full(size, INF_DISTANCE, dtype=np.int32)
+        self.closed_forward = np.zeros(size, dtype=bool)
+        self.closed_backward = np.zeros(size, dtype=bool)
+        self.g_forward[start] = 0
+        self.g_backward[end] = 0
+        
+        self.open_forward = IndexedHeap()
+        self.open_backward = IndexedHeap()
+        h = self.heuristic(start, False)
+        self.open_forward.push(start, (h, h, start))  # (f_score, h, hücre)
+        h = self.heuristic(end, True)
+        self.open_backward.push(end, (h, h, end))
+        self.metrics.pushes = 2
+    
+    def heuristic(self, index, backward):
+        """Geri arama için başlangıca, ileri arama için bitişe Manhattan mesafesi."""
+        return manhattan(index, self.maze.cols, self.start_cell if backward else self.end_cell)
+    
+    def should_stop(self):
+        if not self.open_forward or not self.open_backward:
+            return True
+        if self.meeting_cell == NO_PARENT:
+            return False
+        lower_bound = max(self.open_forward.peek()[0], self.open_backward.peek()[0])
+        return lower_bound >= self.best_length
+    
+    def choose_backward(self):
+        return len(self.open_backward) < len(self.open_forward)
+    
+    def expand_side(self, backward):
+        if backward:
+            open_set, closed, parent = self.open_backward, self.closed_backward, self.parent_back
+            g_score, other_g_score = self.g_backward, self.g_forward
+        else:
+            open_set, closed, parent = self.open_forward, self.closed_forward, self.parent
+            g_score, other_g_score = self.g_forward, self.g_backward
+        
+        current, _ = open_set.pop()
+        self.metrics.pops += 1
+        self.current_cell = self.maze.cell_at(current)
+        closed[current] = True
+        tentative_g_score = int(g_score[current]) + 1
+        
+        for neighbor in self.adjacency.neighbors(current).tolist():
+            if closed[neighbor] or tentative_g_score >= g_score[neighbor]:
+                continue
+            parent[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            self.discover(neighbor, backward)
+            h = self.heuristic(neighbor, backward)
+            open_set.push(neighbor, (tentative_g_score + h, h, neighbor))
+            self.metrics.pushes += 1
+            if other_g_score[neighbor] != INF_DISTANCE:
+                self.meet(neighbor, tentative_g_score + int(other_g_score[neighbor]))
+        
+        self.expanded(current, len(self.open_forward) + len(self.open_backward))
+
+# Algoritma adı -> çözücü sınıfı; menüler ve ölçüm aracı listelerini buradan alır
+ALGORITHMS = {
+    "wall_follower": WallFollower,
+    "dijkstra": Dijkstra,
+    "dead_end_filling": DeadEndFilling,
+    "dead_end_filling_batch": BatchDeadEndFilling,
+    "bfs": BFS,
+    "bfs_batch": BatchBFS,
+    "dfs": DFS,
+    "ids": IDS,
+    "a_star": AStar,
+    "bidirectional_bfs": BidirectionalBFS,
+    "bidirectional_a_star": BidirectionalAStar,
+    "corridor_jump": CorridorJump
+}
+
+def create_algorithm(algo_name, maze=None, **options):
+    """Algoritma adına göre uygun algoritmayı oluştur; options sınıfın kurucusuna iletilir.
+    
+    Bilinmeyen bir ad ValueError verir.
+    """
     if not maze:
         # Sadece karşılaştırma seçimi için boş bir şablon döndür
         return {"name": algo_name}
     
-    algorithms = {
-        "wall_follower": WallFollower,
-        "dijkstra": Dijkstra,
-        "dead_end_filling": DeadEndFilling,
-        "bfs": BFS,
-        "dfs": DFS,
-        "ids": IDS,
-        "a_star": AStar
-    }
-    
-    if algo_name in algorithms:
-        return algorithms[algo_name](maze)
-    
-    # Varsayılan olarak BFS
-    return BFS(maze)
+    if algo_name not in ALGORITHMS:
+        raise ValueError(f"Bilinmeyen çözme algoritması: {algo_name} (geçerli adlar: {', '.join(ALGORITHMS)})")
+    return ALGORITHMS[algo_name](maze, **options)
+
+class SolveResult:
+    """Görselleştirme olmadan çalıştırılan bir çözümün sonucu."""
+    
+    def __init__(self, name, solution_found, path, visited_count, steps, elapsed_time, metrics=None, completed=True):
+        self.name = name
+        self.completed = completed  # max_steps sınırına takıldıysa False
+        self.solution_found = solution_found
+        self.path = path  # (satır, sütun) listesi, başlangıçtan bitişe
+        self.path_length = max(len(path) - 1, 0)
+        self.visited_count = visited_count
+        self.steps = steps
+        self.elapsed_time = elapsed_time
+        self.metrics = metrics  # SolverMetrics (genişletme, ekleme/çıkarma, en büyük sınır)
+    
+    def __repr__(self):
+        return (f"SolveResult({self.name!r}, found={self.solution_found}, "
+                f"path_length={self.path_length}, visited={self.visited_count}, "
+                f"time={self.elapsed_time:.3f}s)")
+
+def solve(maze, algo_name, max_steps=0, **options):
+    """Algoritmayı çizim ve kare beklemesi olmadan sonuna kadar çalıştır.
+    
+    Labirent henüz tamamlanmadıysa önce oluşturma bitirilir. max_steps
+    verilirse arama en fazla o kadar adım sürer ve sonuç completed=False
+    ile döner. options çözücünün kurucusuna iletilir (ör. IDS için
+    schedule). Dönen SolveResult, görselleştiricide yeniden oynatmak için
+    de kullanılabilir.
+    """
+    if not maze.generation_complete:
+        maze.generate()
+    
+    algorithm = create_algorithm(algo_name, maze, **options)
+    algorithm.verbose = False
+    
+    start = time.perf_counter()
+    algorithm.initialize()
+    steps = 0
+    while not algorithm.step():
+        steps += 1
+        if max_steps and steps >= max_steps:
+            break
+    elapsed_time = time.perf_counter() - start
+    
+    path = [(cell.row, cell.col) for cell in algorithm.get_solution_path()]
+    return SolveResult(algorithm.name, algorithm.solution_found, path,
+                       algorithm.visited_count, steps, elapsed_time, algorithm.metrics,
+                       algorithm.is_finished())
+
+class BatchSolveResult:
+    """solve_many sonucu; değerler sorguların verildiği sıradadır."""
+    
+    def __init__(self, lengths, paths, source_count, elapsed_time):
+        self.lengths = lengths  # int32 dizi, ulaşılamayan sorgular için -1
+        self.paths = paths  # (satır, sütun) listeleri (ulaşılamayanlar için boş); paths=False ise None
+        self.source_count = source_count  # Farklı kaynak (başlangıç) hücresi sayısı
+        self.elapsed_time = elapsed_time
+    
+    def __len__(self):
+        return len(self.lengths)
+    
+    def __repr__(self):
+        found = int(np.count_nonzero(self.lengths >= 0))
+        return (f"BatchSolveResult(queries={len(self)}, found={found}, "
+                f"sources={self.source_count}, time={self.elapsed_time:.3f}s)")
+
+def group_queries(maze, queries):
+    """(başlangıç, bitiş) çiftlerini başlangıç hücresine göre grupla: {kaynak: [(sıra, hedef), ...]}."""
+    groups = {}
+    for position, (start, end) in enumerate(queries):
+        source = query_index(maze, start)
+        target = query_index(maze, end)
+        groups.setdefault(source, []).append((position, target))
+    return groups
+
+def query_index(maze, position):
+    """Sorgudaki (satır, sütun) çiftini hücre indeksine çevir; labirent dışındaysa ValueError."""
+    row, col = int(position[0]), int(position[1])
+    if not (0 <= row < maze.rows and 0 <= col < maze.cols):
+        raise ValueError(f"Sorgu hücresi labirentin dışında: ({row}, {col})")
+    return maze.index_of(row, col)
+
+def answer_group(field, cols, items, with_paths):
+    """Bir kaynağın mesafe alanından o kaynağa ait sorguları yanıtla: [(sıra, uzunluk, yol), ...]."""
+    # Ebeveyn zinciri Python listesinde NumPy skaler indekslemesinden çok daha hızlı izlenir
+    parent = field.parent.tolist() if with_paths else None
+    source = field.source
+    answers = []
+    for position, target in items:
+        length = field.distance_to(target)
+        path = None
+        if with_paths:
+            path = []
+            if length is not None:
+                index = target
+                while index != source:
+                    path.append(divmod(index, cols))
+                    index = parent[index]
+                path.append(divmod(source, cols))
+                path.reverse()
+        answers.append((position, -1 if length is None else length, path))
+    return answers
+
+def _solve_groups_worker(shm_name, rows, cols, groups, with_paths, cache_budget=0):
+    """İşçi süreçte, paylaşılan duvarlar üzerinde bir grup listesini yanıtla.
+    
+    Yanıtlarla birlikte toplamı cache_budget baytı aşmayan kadar mesafe
+    alanı da döndürülür; ana süreç bunları labirentin önbelleğine ekler.
+    Bütçeye sığmayan alanlar grup yanıtlanır yanıtlanmaz bırakılır.
+    """
+    with attached_maze(shm_name, rows, cols) as maze:
+        answers = []
+        fields = []
+        for source, items in groups:
+            field = maze.compute_distance_field(source)
+            answers.extend(answer_group(field, cols, items, with_paths))
+            if field.nbytes <= cache_budget:
+                fields.append(field)
+                cache_budget -= field.nbytes
+        return answers, fields
+
+def solve_many(maze, queries, paths=True, max_workers=None):
+    """Bir labirentte çok sayıda (başlangıç, bitiş) sorgusunu toplu olarak yanıtla.
+    
+    queries, ((satır, sütun), (satır, sütun)) çiftleridir. Sorgular
+    başlangıç hücresine göre gruplanır ve her kaynak için tek bir BFS mesafe
+    alanı kullanılır; labirentin start_cell/end_cell alanları değiştirilmez
+    ve çözücü nesnesi oluşturulmaz. Tek süreçte alanlar Maze'in mesafe
+    önbelleğinden alınır (sonraki çağrılar da yararlanır). max_workers
+    verilirse önbellekte olmayan kaynaklar duvarları paylaşılan bellekte
+    gören işçi süreçlere dağıtılır; işçilerin hesapladığı alanlardan
+    önbellek sınırına sığanlar önbelleğe eklenir. paths=False ise sadece uzunluklar hesaplanır.
+    Labirent dışındaki bir başlangıç ya da bitiş ValueError verir.
+    """
+    if not maze.generation_complete:
+        maze.generate()
+    
+    start = time.perf_counter()
+    queries = list(queries)
+    groups = group_queries(maze, queries)
+    lengths = np.full(len(queries), -1, dtype=np.int32)
+    results = [None] * len(queries) if paths else None
+    
+    def record(answers):
+        for position, length, path in answers:
+            lengths[position] = length
+            if paths:
+                results[position] = path
+    
+    remote = []
+    for source, items in groups.items():
+        field = maze.cached_distance_field(source)
+        if field is None and max_workers:
+            remote.append((source, items))
+            continue
+        if field is None:
+            field = maze.get_distance_field(source)
+        record(answer_group(field, maze.cols, items, paths))
+    
+    if remote:
+        # Büyük gruplar önce; her işçiye sırayla bir grup düşer
+        remote.sort(key=lambda group: len(group[1]), reverse=True)
+        workers = min(max_workers, len(remote))
+        batches = [remote[worker::workers] for worker in range(workers)]
+        # Süreç havuzu ve paylaşılan bellek sadece burada gerekir; penceresiz içe aktarma hafif kalsın
+        from concurrent.futures import ProcessPoolExecutor
+        shm = share_walls(maze.walls)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Önbellek sınırı işçiler arasında bölünür; sığmayacak alanlar hiç geri gönderilmez
+                budget = maze.distance_cache_limit // workers
+                futures = [executor.submit(_solve_groups_worker, shm.name, maze.rows, maze.cols, batch, paths, budget)
+                           for batch in batches]
+                for future in futures:
+                    answers, fields = future.result()
+                    record(answers)
+                    for field in fields:
+                        maze.cache_distance_field(field)
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    return BatchSolveResult(lengths, results, len(groups), time.perf_counter() - start)
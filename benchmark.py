@@ -0,0 +1,192 @@
+import csv
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+
+import numpy as np
+
+from maze import Maze, Adjacency
+from algorithms import ALGORITHMS, IDS, solve
+
+# Görselleştirme olmadan labirent üreticilerini ve çözücüleri ölçen karşılaştırma aracı.
+# Süreler işlemci zamanıdır (time.process_time), kare beklemesi veya pencere
+# olayları ölçüme karışmaz. Bellek tepe değeri tracemalloc ile ayrı bir
+# çalıştırmada ölçülür, böylece izleme yükü süreleri bozmaz. Çözücülerin
+# paylaştığı komşuluk indeksi üretimden sonra ayrı bir "index" kaydı olarak
+# ölçülür ve önceden kurulur; böylece ilk çözücünün süresine eklenmez.
+#
+# Örnek:
+#   python benchmark.py --sizes 20 50 100 --seeds 1 2 3 --csv sonuc.csv --json sonuc.json
+
+GENERATORS = ["recursive_backtracking", "prims_algorithm", "binary_tree", "sidewinder", "ellers_algorithm"]
+SOLVERS = list(ALGORITHMS)
+
+FIELDS = [
+    "kind", "generator", "solver", "rows", "cols", "seed", "completed", "solution_found",
+    "cpu_time", "wall_time", "steps", "visited_count", "expansions", "pushes", "pops", "max_frontier",
+    "path_length", "peak_memory",
+]
+
+
+def build_maze(generator, size, seed):
+    maze = Maze(size, size, seed=seed)
+    maze.set_generation_algorithm(generator, seed=seed)
+    return maze
+
+
+def measure(function, repeat):
+    """function'ı repeat kez çalıştır; en düşük işlemci ve duvar saati süresini döndür."""
+    best_cpu = best_wall = float("inf")
+    result = None
+    for _ in range(repeat):
+        cpu, wall = time.process_time(), time.perf_counter()
+        result = function()
+        best_cpu = min(best_cpu, time.process_time() - cpu)
+        best_wall = min(best_wall, time.perf_counter() - wall)
+    return result, best_cpu, best_wall
+
+
+def peak_memory(function):
+    """function çalışırken ayrılan belleğin tepe değeri (bayt)."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_generator(generator, size, seed, repeat, memory):
+    def generate():
+        maze = build_maze(generator, size, seed)
+        maze.generate()
+        return maze
+
+    maze, cpu_time, wall_time = measure(generate, repeat)
+    return maze, {
+        "kind": "generate", "generator": generator, "solver": "", "rows": size, "cols": size,
+        "seed": seed, "completed": True, "solution_found": "",
+        "cpu_time": cpu_time, "wall_time": wall_time, "steps": "", "visited_count": "",
+        "expansions": "", "pushes": "", "pops": "", "max_frontier": "", "path_length": "", "peak_memory": peak_memory(generate) if memory else "",
+    }
+
+
+def benchmark_index(maze, generator, size, seed, repeat, memory):
+    """Çözücülerin paylaştığı komşuluk indeksini ölç ve labirentte hazır bırak."""
+    build = lambda: Adjacency.from_walls(maze.walls, maze.rows, maze.cols)
+    _, cpu_time, wall_time = measure(build, repeat)
+    record = {
+        "kind": "index", "generator": generator, "solver": "", "rows": size, "cols": size,
+        "seed": seed, "completed": True, "solution_found": "",
+        "cpu_time": cpu_time, "wall_time": wall_time, "steps": "", "visited_count": "",
+        "expansions": "", "pushes": "", "pops": "", "max_frontier": "", "path_length": "", "peak_memory": peak_memory(build) if memory else "",
+    }
+    maze.get_adjacency()
+    return record
+
+
+def benchmark_solver(maze, generator, solver, size, seed, repeat, memory, max_steps, ids_schedule="geometric"):
+    options = {"schedule": ids_schedule} if ALGORITHMS[solver] is IDS else {}
+    run = lambda: solve(maze, solver, max_steps, **options)
+    result, cpu_time, wall_time = measure(run, repeat)
+    return {
+        "kind": "solve", "generator": generator, "solver": solver, "rows": size, "cols": size,
+        "seed": seed, "completed": result.completed, "solution_found": result.solution_found,
+        "cpu_time": cpu_time, "wall_time": wall_time, "steps": result.steps,
+        "visited_count": result.visited_count, "expansions": result.metrics.expansions,
+        "pushes": result.metrics.pushes, "pops": result.metrics.pops,
+        "max_frontier": result.metrics.max_frontier, "path_length": result.path_length,
+        "peak_memory": peak_memory(run) if memory else "",
+    }
+
+
+def run_benchmarks(sizes, generators, solvers, seeds, repeat=1, memory=True, max_steps=0, progress=None,
+                   ids_schedule="geometric"):
+    """Tüm boyut × üretici × tohum × çözücü kombinasyonlarını ölç, kayıt listesi döndür."""
+    records = []
+    for size in sizes:
+        for generator in generators:
+            for seed in seeds:
+                maze, record = benchmark_generator(generator, size, seed, repeat, memory)
+                index_record = benchmark_index(maze, generator, size, seed, repeat, memory)
+                for record in (record, index_record):
+                    records.append(record)
+                    if progress:
+                        progress(record)
+                for solver in solvers:
+                    record = benchmark_solver(maze, generator, solver, size, seed, repeat, memory, max_steps,
+                                              ids_schedule)
+                    records.append(record)
+                    if progress:
+                        progress(record)
+    return records
+
+
+def environment():
+    """Raporlara eklenen çalışma ortamı bilgisi."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def write_json(path, records, settings):
+    with open(path, "w") as file:
+        json.dump({"environment": environment(), "settings": settings, "results": records}, file, indent=2)
+
+
+def print_record(record):
+    name = record["solver"] or record["generator"]
+    status = "" if record["completed"] else " (adım sınırı)"
+    memory = f" {record['peak_memory'] / 1024:.0f} KiB" if record["peak_memory"] != "" else ""
+    line = (f"{record['kind']:8} {record['generator']:22} {name:22} {record['rows']}x{record['cols']} "
+            f"seed={record['seed']} cpu={record['cpu_time'] * 1000:.1f}ms{memory}")
+    if record["kind"] == "solve":
+        line += (f" steps={record['steps']} visited={record['visited_count']} expansions={record['expansions']}"
+                 f" frontier={record['max_frontier']} path={record['path_length']}")
+    print(line + status)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Labirent üretici ve çözücülerini görselleştirme olmadan ölç")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 50, 100], help="Labirent kenar uzunlukları")
+    parser.add_argument("--generators", nargs="+", default=GENERATORS, choices=GENERATORS)
+    parser.add_argument("--solvers", nargs="+", default=SOLVERS, choices=SOLVERS)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--repeat", type=int, default=1, help="Her ölçüm kaç kez tekrarlansın (en iyisi alınır)")
+    parser.add_argument("--max-steps", type=int, default=1_000_000,
+                        help="Çözücü başına adım sınırı (0 = sınırsız); IDS büyük labirentlerde çok yavaştır")
+    parser.add_argument("--ids-schedule", default="geometric", choices=IDS.SCHEDULES,
+                        help="IDS derinleştirme planı")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc ile bellek ölçümünü atla")
+    parser.add_argument("--csv", help="Sonuçları bu CSV dosyasına yaz")
+    parser.add_argument("--json", help="Sonuçları bu JSON dosyasına yaz")
+    parser.add_argument("--quiet", action="store_true", help="Satır satır ilerleme çıktısını kapat")
+    args = parser.parse_args(argv)
+
+    records = run_benchmarks(args.sizes, args.generators, args.solvers, args.seeds,
+                             repeat=args.repeat, memory=not args.no_memory, max_steps=args.max_steps,
+                             progress=None if args.quiet else print_record, ids_schedule=args.ids_schedule)
+
+    settings = {key: value for key, value in vars(args).items() if key not in ("csv", "json", "quiet")}
+    if args.csv:
+        write_csv(args.csv, records)
+    if args.json:
+        write_json(args.json, records, settings)
+    return records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+import time
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from maze import attached_maze, share_walls
+from algorithms import create_algorithm
+
+# Karşılaştırmayı süreç havuzunda çalıştıran motor. Labirent duvarları bir
+# paylaşılan bellek bloğuna bir kez kopyalanır; işçiler bu bloğu kopyalamadan
+# eşler, her algoritmayı kendi çekirdeğinde sonuna kadar çalıştırır ve
+# arayüze ilerleme anlık görüntüleri gönderir.
+
+SNAPSHOT_INTERVAL = 0.05  # İşçilerin ilerleme göndermesi arasındaki süre (saniye)
+SNAPSHOT_CHECK_STEPS = 256  # Saat kontrolü bu kadar adımda bir yapılır
+
+# İşçi süreçlerinde initializer ile ayarlanır
+_progress_queue = None
+_cancel_event = None
+
+
+def _init_worker(progress_queue, cancel_event):
+    global _progress_queue, _cancel_event
+    _progress_queue = progress_queue
+    _cancel_event = cancel_event
+    # İlerleme mesajları kaybolabilir; işçi, okunmamış mesajlar yüzünden çıkışta beklemesin
+    progress_queue.cancel_join_thread()
+
+
+def _snapshot(slot, algorithm, steps, finished):
+    """Arayüze gönderilecek ilerleme durumu (ziyaret bit haritası paketlenmiş halde)."""
+    return {
+        "slot": slot,
+        "steps": steps,
+        "visited_count": algorithm.visited_count,
+        "elapsed_time": time.time() - algorithm.start_time,
+        "visited": np.packbits(algorithm.visited),
+        "backward_visited": None if algorithm.backward_visited is None else np.packbits(algorithm.backward_visited),
+        "finished": finished,
+    }
+
+
+def run_solver(slot, shm_name, rows, cols, start, end, algo_name, snapshot_interval=SNAPSHOT_INTERVAL):
+    """İşçi süreçte bir algoritmayı paylaşılan labirent üzerinde sonuna kadar çalıştır."""
+    with attached_maze(shm_name, rows, cols) as maze:
+        maze.set_endpoints(start, end)
+
+        algorithm = create_algorithm(algo_name, maze)
+        algorithm.verbose = False
+        algorithm.initialize()
+
+        steps = 0
+        next_snapshot = time.time() + snapshot_interval
+        while not algorithm.step():
+            steps += 1
+            if steps % SNAPSHOT_CHECK_STEPS == 0:
+                if _cancel_event is not None and _cancel_event.is_set():
+                    return None
+                now = time.time()
+                if _progress_queue is not None and now >= next_snapshot:
+                    _progress_queue.put(_snapshot(slot, algorithm, steps, False))
+                    next_snapshot = now + snapshot_interval
+
+        result = _snapshot(slot, algorithm, steps, True)
+        result.update({
+            "elapsed_time": algorithm.elapsed_time,
+            "solution_found": algorithm.solution_found,
+            "path_length": algorithm.path_length,
+            "solution_cells": np.fromiter(algorithm.solution_cells, dtype=np.int32),
+        })
+        return result
+
+
+class RemoteSolver:
+    """Başka bir süreçte çalışan algoritmanın arayüz tarafındaki görünümü.
+
+    Karşılaştırma ekranı ve MazeRenderer için MazeSolvingAlgorithm ile aynı
+    alanları sunar; değerler işçiden gelen anlık görüntülerle güncellenir.
+    """
+
+    def __init__(self, maze, algo_name):
+        self.algo_name = algo_name
+        self.name = create_algorithm(algo_name, maze).name
+        self.size = maze.size
+        self.visited = None
+        self.backward_visited = None
+        self.solution_cells = set()
+        self.show_visited = True
+        self.solution_found = False
+        self._is_finished = False
+        self.visited_count = 0
+        self.path_length = 0
+        self.steps = 0
+        self.elapsed_time = 0
+        self.dirty_cells = set()
+        self.full_redraw = True
+
+    def is_finished(self):
+        return self._is_finished
+
+    def step(self):
+        # Adımlar işçi süreçte atılır; burada sadece durum sorgulanır
+        return self._is_finished
+
+    def mark_all_dirty(self):
+        self.full_redraw = True
+        self.dirty_cells = set()
+
+    def apply(self, snapshot):
+        """İşçiden gelen anlık görüntüyü uygula."""
+        self.steps = snapshot["steps"]
+        self.visited_count = snapshot["visited_count"]
+        self.elapsed_time = snapshot["elapsed_time"]
+        self.visited = np.unpackbits(snapshot["visited"], count=self.size).astype(bool)
+        if snapshot["backward_visited"] is not None:
+            self.backward_visited = np.unpackbits(snapshot["backward_visited"], count=self.size).astype(bool)
+        if snapshot["finished"]:
+            self.solution_found = snapshot["solution_found"]
+            self.path_length = snapshot["path_length"]
+            self.solution_cells = set(snapshot["solution_cells"].tolist())
+            self._is_finished = True
+        self.mark_all_dirty()
+
+
+class ParallelComparison:
+    """Seçilen algoritmaları bir ProcessPoolExecutor üzerinde aynı anda çalıştırır.
+
+    Toplam süre en yavaş algoritmanın süresi kadardır. start() işleri
+    gönderir; arayüz her karede poll() çağırarak ilerlemeyi alır; close()
+    bitmemiş işleri iptal eder ve paylaşılan belleği serbest bırakır.
+    """
+
+    def __init__(self, maze, algo_names, max_workers=None):
+        self.maze = maze
+        self.algo_names = list(algo_names)
+        self.max_workers = max_workers or len(self.algo_names)
+        self.solvers = [RemoteSolver(maze, name) for name in self.algo_names]
+        self.shm = None
+        self.executor = None
+        self.futures = []
+        self.progress_queue = None
+        self.cancel_event = None
+
+    def start(self):
+        maze = self.maze
+        # Duvarlar paylaşılan belleğe bir kez kopyalanır; işçilere sadece bloğun adı gider
+        self.shm = share_walls(maze.walls)
+
+        self.progress_queue = multiprocessing.Queue()
+        self.cancel_event = multiprocessing.Event()
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                            initargs=(self.progress_queue, self.cancel_event))
+        start = (maze.start_cell.row, maze.start_cell.col)
+        end = (maze.end_cell.row, maze.end_cell.col)
+        self.futures = [
+            self.executor.submit(run_solver, slot, self.shm.name, maze.rows, maze.cols, start, end, name)
+            for slot, name in enumerate(self.algo_names)
+        ]
+
+    def poll(self):
+        """Bekleyen ilerleme mesajlarını ve biten sonuçları uygula; hepsi bittiyse True döndür."""
+        for snapshot in self.drain():
+            solver = self.solvers[snapshot["slot"]]
+            if not solver.is_finished():
+                solver.apply(snapshot)
+
+        for solver, future in zip(self.solvers, self.futures):
+            if not solver.is_finished() and future.done():
+                error = future.exception()
+                if error is not None:
+                    print(f"{solver.name} çalıştırılırken hata oluştu: {error}")
+                    solver._is_finished = True
+                elif future.result() is not None:
+                    solver.apply(future.result())
+        return all(solver.is_finished() for solver in self.solvers)
+
+    def drain(self):
+        """Kuyruktaki tüm ilerleme mesajlarını al; aynı algoritmanın eskileri atlanır."""
+        latest = {}
+        while True:
+            try:
+                snapshot = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[snapshot["slot"]] = snapshot
+        return latest.values()
+
+    def close(self):
+        """Çalışan işleri durdur ve kaynakları bırak."""
+        if self.executor is not None:
+            self.cancel_event.set()
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            # İşçiler bitene kadar kuyruğu boşalt; dolu bir boru işçiyi bloke edebilir
+            while not all(future.done() for future in self.futures):
+                self.drain()
+                time.sleep(0.01)
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        if self.progress_queue is not None:
+            self.progress_queue.close()
+            self.progress_queue = None
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
@@ -2,15 +2,11 @@ import pygame
 import sys
 from maze import Maze
 from algorithms import *
+from comparison import ParallelComparison
 from ui import UI
 
-# Pygame başlangıç ayarları
-pygame.init()
-pygame.font.init()
+# Pencere boyutu - pygame sadece MazeSolver oluşturulduğunda başlatılır
 width, height = 1200, 800
-screen = pygame.display.set_mode((width, height))
-pygame.display.set_caption("Maze Solver Visualizer")
-clock = pygame.time.Clock()
 
 # Renkler
 WHITE = (255, 255, 255)
@@ -23,13 +19,20 @@ GRAY = (200, 200, 200)
 
 class MazeSolver:
     def __init__(self):
-        self.ui = UI(screen, width, height)
+        # Pygame başlangıç ayarları
+        pygame.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((width, height))
+        pygame.display.set_caption("Maze Solver Visualizer")
+        self.clock = pygame.time.Clock()
+        
+        self.ui = UI(self.screen, width, height)
         self.maze = None
-        self.screen = screen
         self.running = True
         self.state = "main"  # main, solving, comparison, comparison_selection, generating_maze
         self.current_algorithm = None
         self.comparison_algorithms = []
+        self.comparison_engine = None  # Paralel karşılaştırmada süreç havuzu motoru
         self.paused = False  # Duraklatma durumu
         self._after_generation = None  # Labirent oluşturma sonrası yapılacak işlem
         self.solution_message_shown = False  # Çözüm mesajının gösterilip gösterilmediğini kontrol eden bayrak
@@ -55,7 +58,10 @@ class MazeSolver:
                 self.handle_generating_maze(events)
                 
             pygame.display.flip()
-            clock.tick(60)
+            self.clock.tick(60)
+        
+        # Çıkarken çalışan paralel karşılaştırmayı durdur
+        self.stop_comparison_engine()
     
     def handle_main_screen(self, events):
         for event in events:
@@ -147,7 +153,7 @@ class MazeSolver:
                     pass
         
         # Ana ekranı çiz
-        self.ui.draw_main_screen(self.maze)
+        self.ui.draw_main_screen(self.maze, self.current_algorithm)
         
         # Eğer algoritma çalışıyorsa bilgileri göster
         if self.current_algorithm:
@@ -167,8 +173,7 @@ class MazeSolver:
                     self._after_generation = None
                 if event.key == pygame.K_SPACE:
                     # Hızlı tamamlama - tüm adımları tamamla
-                    while not self.maze.generation_complete:
-                        self.maze.generate_step()
+                    self.maze.generate()
 
         # Labirent oluşturma adımını yap
         is_complete = self.maze.generate_step()
@@ -307,7 +312,7 @@ class MazeSolver:
                         if not self.solution_message_shown:  # Eğer mesaj daha önce gösterilmediyse
                             print(f"Çözüm bulundu! Süre: {self.current_algorithm.elapsed_time:.3f}s")
                             self.solution_message_shown = True  # Mesaj gösterildi olarak işaretle
-                        self.maze.clear_path_only()  # Sadece ziyaret izlerini temizle, çözüm yolunu koru
+                        self.current_algorithm.hide_visited()  # Sadece ziyaret izlerini gizle, çözüm yolunu koru
                     else:
                         # Çözüm bulunamadıysa, bir mesaj göster
                         if not self.solution_message_shown:  # Eğer mesaj daha önce gösterilmediyse
@@ -319,7 +324,7 @@ class MazeSolver:
                 self.state = "main"
         
         # Ana ekranı çiz
-        self.ui.draw_main_screen(self.maze)
+        self.ui.draw_main_screen(self.maze, self.current_algorithm)
         self.ui.draw_solving_info(self.current_algorithm)
         
         # Duraklatma durumunu göster
@@ -365,18 +370,25 @@ class MazeSolver:
         # Karşılaştırma algoritmalarını oluştur
         selected_algos = self.ui.get_comparison_algorithms()
         self.comparison_algorithms = []
+        self.stop_comparison_engine()
         
         # Mevcut labirenti temizle ve kopyala
         # Orijinal maze'in yapısını karşılaştırma için koruyoruz
         if self.maze:
             self.maze.clear_solution()  # Önce çözüm izlerini temizle
             
-            # Tüm seçilen algoritmalar için labirenti kullan
-            for algo_name in selected_algos:
-                # Her algoritma için aynı maze kopya kullanılır
-                algorithm = create_algorithm(algo_name, self.maze)
-                algorithm.initialize()
-                self.comparison_algorithms.append(algorithm)
+            if self.ui.is_parallel_comparison() and len(selected_algos) >= 2:
+                # Her algoritma ayrı bir süreçte çalışır; labirent paylaşılan bellekle aktarılır
+                self.comparison_engine = ParallelComparison(self.maze, selected_algos)
+                self.comparison_engine.start()
+                self.comparison_algorithms = self.comparison_engine.solvers
+            else:
+                # Tüm seçilen algoritmalar için labirenti kullan
+                for algo_name in selected_algos:
+                    # Her algoritma aynı maze'i kullanır; arama durumu algoritmanın kendisindedir
+                    algorithm = create_algorithm(algo_name, self.maze)
+                    algorithm.initialize()
+                    self.comparison_algorithms.append(algorithm)
         
         # Yeterli algoritma seçimi yoksa uyarı ver
         if len(self.comparison_algorithms) < 2:
@@ -385,6 +397,12 @@ class MazeSolver:
         
         self.state = "comparison"
     
+    def stop_comparison_engine(self):
+        """Paralel karşılaştırma çalışıyorsa işçileri durdur ve kaynakları bırak"""
+        if self.comparison_engine:
+            self.comparison_engine.close()
+            self.comparison_engine = None
+    
     def handle_comparison(self, events):
         for event in events:
             if event.type == pygame.QUIT:
@@ -392,6 +410,7 @@ class MazeSolver:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.state = "main"
+                    self.stop_comparison_engine()
                     if self.maze:
                         self.maze.clear_solution()
                 if event.key == pygame.K_SPACE:
@@ -403,12 +422,18 @@ class MazeSolver:
             action = self.ui.handle_comparison_events(event)
             if action == "back_to_main":
                 self.state = "main"
+                self.stop_comparison_engine()
                 if self.maze:
                     self.maze.clear_solution()
         
         # Tüm algoritmaları bir adım ilerlet
         all_finished = True
-        if not self.paused:
+        if self.comparison_engine:
+            # Paralel modda adımlar işçilerde atılır; burada sadece ilerleme okunur
+            # (duraklatma sadece ekranı dondurur)
+            if not self.paused:
+                all_finished = self.comparison_engine.poll()
+        elif not self.paused:
             for algorithm in self.comparison_algorithms:
                 if not algorithm.is_finished():
                     finished = algorithm.step()
@@ -1,52 +1,864 @@
 import numpy as np
+import heapq
 import random
-import pygame
+import struct
+from collections import OrderedDict
+from contextlib import contextmanager
+from collections.abc import Mapping
+
+# Duvar bitleri - her hücrenin dört duvarı tek bir uint8 içinde saklanır
+WALL_TOP = 1
+WALL_RIGHT = 2
+WALL_BOTTOM = 4
+WALL_LEFT = 8
+ALL_WALLS = WALL_TOP | WALL_RIGHT | WALL_BOTTOM | WALL_LEFT
+
+# Yön adı -> (duvar biti, satır farkı, sütun farkı, komşudaki karşı duvar biti)
+DIRECTIONS = {
+    "top": (WALL_TOP, -1, 0, WALL_BOTTOM),
+    "right": (WALL_RIGHT, 0, 1, WALL_LEFT),
+    "bottom": (WALL_BOTTOM, 1, 0, WALL_TOP),
+    "left": (WALL_LEFT, 0, -1, WALL_RIGHT),
+}
+WALL_NAMES = ("top", "right", "bottom", "left")
+
+# Hücre durum bitleri (Maze.flags dizisinde)
+FLAG_VISITED = 1
+FLAG_IN_MAZE = 2  # Prim algoritması için
+FLAG_START = 4
+FLAG_END = 8
+FLAG_PATH = 16
+FLAG_SOLUTION = 32
+
+NO_PARENT = -1
+INF_DISTANCE = np.iinfo(np.int32).max  # float('inf') yerine kullanılan değer
+DISTANCE_CACHE_LIMIT = 64 * 1024 * 1024  # Mesafe alanı önbelleğinin varsayılan bayt sınırı
+
+
+def _flag_property(flag):
+    """Maze.flags dizisindeki bir biti okuyan/yazan özellik oluştur."""
+    def getter(self):
+        return bool(self.maze.flags[self.index] & flag)
+
+    def setter(self, value):
+        flags = self.maze.flags[self.index]
+        updated = flags | flag if value else flags & (0xFF ^ flag)
+        if updated != flags:
+            self.maze.flags[self.index] = updated
+            self.maze.mark_dirty(self.index)
+
+    return property(getter, setter)
+
+
+class CellWalls(Mapping):
+    """Bir hücrenin duvar bitlerine sözlük gibi erişim sağlayan görünüm."""
+    __slots__ = ("maze", "index")
+
+    def __init__(self, maze, index):
+        self.maze = maze
+        self.index = index
+
+    def __getitem__(self, direction):
+        return bool(self.maze.walls[self.index] & DIRECTIONS[direction][0])
+
+    def __setitem__(self, direction, value):
+        self.maze.set_wall_bit(self.index, DIRECTIONS[direction][0], value)
+
+    def __iter__(self):
+        return iter(WALL_NAMES)
+
+    def __len__(self):
+        return len(WALL_NAMES)
+
+    def __repr__(self):
+        return repr(dict(self))
+
 
 class Cell:
-    def __init__(self, row, col):
+    """Labirent dizileri üzerinde hafif bir hücre görünümü.
+
+    Hücre verileri Maze içindeki paralel NumPy dizilerinde tutulur; bu sınıf
+    sadece (satır, sütun) konumunu taşır ve özellikleri bu dizilere yönlendirir.
+    """
+    __slots__ = ("maze", "row", "col", "index")
+
+    def __init__(self, maze, row, col):
+        self.maze = maze
         self.row = row
         self.col = col
-        self.walls = {"top": True, "right": True, "bottom": True, "left": True}
-        self.visited = False
-        self.in_maze = False  # Prim algoritması için
-        self.is_start = False
-        self.is_end = False
-        self.is_path = False
-        self.is_solution = False
-        self.distance = float('inf')  # Dijkstra ve A* için
-        self.heuristic = 0  # A* için
-        self.parent = None  # Çözüm yolunu yeniden oluşturmak için
-        
+        self.index = row * maze.cols + col
+
+    visited = _flag_property(FLAG_VISITED)
+    in_maze = _flag_property(FLAG_IN_MAZE)  # Prim algoritması için
+    is_start = _flag_property(FLAG_START)
+    is_end = _flag_property(FLAG_END)
+    is_path = _flag_property(FLAG_PATH)
+    is_solution = _flag_property(FLAG_SOLUTION)
+
+    @property
+    def walls(self):
+        return CellWalls(self.maze, self.index)
+
+    @walls.setter
+    def walls(self, walls):
+        bits = 0
+        for direction, present in walls.items():
+            if present:
+                bits |= DIRECTIONS[direction][0]
+        self.maze.set_walls(self.index, bits)
+
+    @property
+    def distance(self):
+        # Dijkstra ve A* için
+        distance = self.maze.distance[self.index]
+        return float('inf') if distance == INF_DISTANCE else int(distance)
+
+    @distance.setter
+    def distance(self, value):
+        self.maze.distance[self.index] = INF_DISTANCE if value == float('inf') else value
+
+    @property
+    def parent(self):
+        # Çözüm yolunu yeniden oluşturmak için
+        parent = self.maze.parent[self.index]
+        return None if parent == NO_PARENT else self.maze.cell_at(int(parent))
+
+    @parent.setter
+    def parent(self, cell):
+        self.maze.parent[self.index] = NO_PARENT if cell is None else cell.index
+
+    def __eq__(self, other):
+        return isinstance(other, Cell) and other.maze is self.maze and other.index == self.index
+
+    def __hash__(self):
+        return hash(self.index)
+
+    def __repr__(self):
+        return f"Cell({self.row}, {self.col})"
+
     def reset_path_data(self):
         self.visited = False
         self.is_path = False
         self.is_solution = False
         self.distance = float('inf')
         self.parent = None
-    
+
     def get_neighbors(self, grid, include_walls=False):
         neighbors = []
-        rows, cols = len(grid), len(grid[0])
-        directions = [("top", -1, 0), ("right", 0, 1), ("bottom", 1, 0), ("left", 0, -1)]
-        
-        for direction, dr, dc in directions:
+        walls = self.maze.walls[self.index]
+
+        for direction in WALL_NAMES:
+            bit, dr, dc, _ = DIRECTIONS[direction]
             nr, nc = self.row + dr, self.col + dc
-            if 0 <= nr < rows and 0 <= nc < cols:
-                neighbor_cell = grid[nr][nc]
+            if 0 <= nr < self.maze.rows and 0 <= nc < self.maze.cols:
                 # Bu yönde duvar yoksa veya duvarları dahil etmek istiyorsak komşuyu ekleyelim
-                if not self.walls[direction] or include_walls:
-                    neighbors.append(neighbor_cell)
-        
+                if not walls & bit or include_walls:
+                    neighbors.append(Cell(self.maze, nr, nc))
+
         return neighbors
 
+
+class MazeRow:
+    """grid[row][col] erişimi için tek bir satırın görünümü."""
+    __slots__ = ("maze", "row")
+
+    def __init__(self, maze, row):
+        self.maze = maze
+        self.row = row
+
+    def __len__(self):
+        return self.maze.cols
+
+    def __getitem__(self, col):
+        if col < 0:
+            col += self.maze.cols
+        if not 0 <= col < self.maze.cols:
+            raise IndexError("sütun labirent dışında")
+        return Cell(self.maze, self.row, col)
+
+    def __iter__(self):
+        for col in range(self.maze.cols):
+            yield Cell(self.maze, self.row, col)
+
+
+class MazeGrid:
+    """Hücreleri sadece erişildiğinde oluşturan ızgara görünümü."""
+    __slots__ = ("maze",)
+
+    def __init__(self, maze):
+        self.maze = maze
+
+    def __len__(self):
+        return self.maze.rows
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.maze.rows
+        if not 0 <= row < self.maze.rows:
+            raise IndexError("satır labirent dışında")
+        return MazeRow(self.maze, row)
+
+    def __iter__(self):
+        for row in range(self.maze.rows):
+            yield MazeRow(self.maze, row)
+
+def neighbor_table(walls, rows, cols):
+    """Her hücrenin dört yöndeki duvarsız komşusu ((rows * cols, 4) dizi, yoksa NO_PARENT).
+
+    Sütunlar üst, sağ, alt, sol sırasındadır.
+    """
+    grid_walls = walls.reshape(rows, cols)
+    index = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    neighbors = np.full((rows, cols, 4), NO_PARENT, dtype=np.int32)
+
+    neighbors[1:, :, 0] = np.where(grid_walls[1:] & WALL_TOP, NO_PARENT, index[:-1])
+    neighbors[:, :-1, 1] = np.where(grid_walls[:, :-1] & WALL_RIGHT, NO_PARENT, index[:, 1:])
+    neighbors[:-1, :, 2] = np.where(grid_walls[:-1] & WALL_BOTTOM, NO_PARENT, index[1:])
+    neighbors[:, 1:, 3] = np.where(grid_walls[:, 1:] & WALL_LEFT, NO_PARENT, index[:, :-1])
+    return neighbors.reshape(rows * cols, 4)
+
+
+class Adjacency:
+    """Duvarsız komşulukların CSR (sıkıştırılmış satır) gösterimi.
+
+    i. hücrenin komşuları targets[offsets[i]:offsets[i + 1]] aralığındadır;
+    sıralama get_neighbors ile aynıdır (üst, sağ, alt, sol). table aynı
+    bilginin sabit genişlikli (hücre, yön) hali olup vektörel aramalarda
+    kullanılır.
+    """
+    __slots__ = ("offsets", "targets", "table")
+
+    def __init__(self, offsets, targets, table=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.table = table
+
+    @classmethod
+    def from_walls(cls, walls, rows, cols):
+        """Duvar bit dizisinden komşuluk indeksini vektörel olarak oluştur."""
+        neighbors = neighbor_table(walls, rows, cols)
+        is_open = neighbors != NO_PARENT
+        offsets = np.zeros(rows * cols + 1, dtype=np.int64)
+        np.cumsum(is_open.sum(axis=1), out=offsets[1:])
+        return cls(offsets, neighbors[is_open], neighbors)
+
+    def neighbors(self, index):
+        """Bir hücrenin duvarsız komşularının indeksleri."""
+        return self.targets[self.offsets[index]:self.offsets[index + 1]]
+
+    def degrees(self):
+        """Her hücrenin açık bağlantı sayısı."""
+        return np.diff(self.offsets)
+
+
+SMALL_FRONTIER = 64  # Bundan küçük BFS seviyeleri ve doldurma dalgaları düz Python ile genişletilir
+
+
+def bfs_level(table, frontier, distance, parent, depth):
+    """Seviye eşzamanlı BFS'nin bir adımı: sınırdaki tüm hücreleri birlikte genişlet.
+
+    Henüz ulaşılmamış komşulara depth mesafesi ve ebeveyn yazılır; yeni sınır
+    döndürülür. Aynı hücreye birden fazla sınır hücresinden ulaşılırsa
+    ebeveyn yazımını kazanan kaynak seçilir, böylece sınırda tekrar olmaz.
+    Uzun koridorlarda NumPy çağrılarının sabit maliyeti baskın olduğundan
+    küçük sınırlar hücre hücre işlenir.
+    """
+    if len(frontier) < SMALL_FRONTIER:
+        following = []
+        for current in frontier.tolist():
+            for neighbor in table[current].tolist():
+                if neighbor != NO_PARENT and distance[neighbor] == INF_DISTANCE:
+                    distance[neighbor] = depth
+                    parent[neighbor] = current
+                    following.append(neighbor)
+        return np.array(following, dtype=np.int32)
+
+    neighbors = table[frontier].ravel()
+    sources = np.repeat(frontier, table.shape[1])
+    is_open = neighbors != NO_PARENT
+    neighbors, sources = neighbors[is_open], sources[is_open]
+    fresh = distance[neighbors] == INF_DISTANCE
+    neighbors, sources = neighbors[fresh], sources[fresh]
+    parent[neighbors] = sources
+    distance[neighbors] = depth
+    return neighbors[parent[neighbors] == sources]
+
+
+class DistanceField:
+    """Bir kaynak hücreden tüm hücrelere BFS mesafeleri ve ebeveynleri.
+
+    Seviye eşzamanlı, vektörel BFS ile tek seferde oluşturulur. Ulaşılamayan
+    hücrelerin mesafesi INF_DISTANCE'tır. levels kaynağa en uzak ulaşılan
+    hücrenin mesafesidir. Aynı alan kaynaktan herhangi bir hücreye en kısa
+    yol sorgularını path_to ile yanıtlar.
+    """
+    __slots__ = ("source", "distance", "parent", "levels")
+
+    def __init__(self, source, distance, parent, levels):
+        self.source = source
+        self.distance = distance
+        self.parent = parent
+        self.levels = levels
+
+    @classmethod
+    def from_adjacency(cls, adjacency, source):
+        """Komşuluk tablosu üzerinde source'tan başlayan tüm seviyeleri genişlet."""
+        table = adjacency.table
+        size = len(table)
+        distance = np.full(size, INF_DISTANCE, dtype=np.int32)
+        parent = np.full(size, NO_PARENT, dtype=np.int32)
+        distance[source] = 0
+        frontier = np.array([source], dtype=np.int32)
+        depth = 0
+        while len(frontier):
+            depth += 1
+            frontier = bfs_level(table, frontier, distance, parent, depth)
+        return cls(source, distance, parent, depth - 1)
+
+    @property
+    def nbytes(self):
+        """Alanın kapladığı bellek (bayt)."""
+        return self.distance.nbytes + self.parent.nbytes
+
+    def reachable(self):
+        """Kaynaktan ulaşılabilen hücrelerin bit haritası."""
+        return self.distance != INF_DISTANCE
+
+    def distance_to(self, index):
+        """Kaynaktan hücreye en kısa yol uzunluğu (ulaşılamıyorsa None)."""
+        distance = int(self.distance[index])
+        return None if distance == INF_DISTANCE else distance
+
+    def path_to(self, index):
+        """Kaynaktan hücreye en kısa yol (hücre indeksleri); ulaşılamıyorsa boş liste."""
+        if self.distance[index] == INF_DISTANCE:
+            return []
+        path = [int(index)]
+        while path[-1] != self.source:
+            path.append(int(self.parent[path[-1]]))
+        path.reverse()
+        return path
+
+
+class JunctionGraph:
+    """Koridorları sıkıştırılmış labirent grafı.
+
+    Düğümler iki bağlantılı olmayan hücreler (kavşaklar, çıkmaz sokaklar) ile
+    başlangıç ve bitiştir; kenarlar aradaki koridorlardır. node_of bir hücrenin
+    düğüm numarasını (düğüm değilse NO_PARENT) verir. Düğüm i'nin kenarları
+    offsets[i]:offsets[i + 1] aralığındadır: targets komşu düğüm, lengths
+    koridor uzunluğu (adım sayısı), corridors koridor numarası. Koridor k'nın
+    iç hücreleri cells[cell_offsets[k]:cell_offsets[k + 1]] aralığında,
+    corridor_ends[k, 0] düğümünden corridor_ends[k, 1] düğümüne doğru sıralıdır.
+    """
+    __slots__ = ("nodes", "node_of", "offsets", "targets", "lengths", "corridors",
+                 "corridor_ends", "cell_offsets", "cells", "_edge_lists")
+
+    def __init__(self, nodes, node_of, offsets, targets, lengths, corridors, corridor_ends, cell_offsets, cells):
+        self.nodes = nodes
+        self.node_of = node_of
+        self.offsets = offsets
+        self.targets = targets
+        self.lengths = lengths
+        self.corridors = corridors
+        self.corridor_ends = corridor_ends
+        self.cell_offsets = cell_offsets
+        self.cells = cells
+        self._edge_lists = None  # Sorgular için kenar dizilerinin Python listesi kopyası
+
+    @classmethod
+    def from_adjacency(cls, adjacency, terminals=()):
+        """Komşuluk indeksinden grafı oluştur; terminals her zaman düğüm olan hücrelerdir."""
+        size = len(adjacency.offsets) - 1
+        is_node = adjacency.degrees() != 2
+        is_node[list(terminals)] = True
+        nodes = np.flatnonzero(is_node).astype(np.int32)
+        node_of = np.full(size, NO_PARENT, dtype=np.int32)
+        node_of[nodes] = np.arange(len(nodes), dtype=np.int32)
+
+        # Koridor yürüyüşü hücre başına Python işlemi olduğundan diziler listeye çevrilir
+        offsets = adjacency.offsets.tolist()
+        targets = adjacency.targets.tolist()
+        node_flags = is_node.tolist()
+        seen = bytearray(size)
+        ends, runs = [], []
+        for node in nodes.tolist():
+            for first in targets[offsets[node]:offsets[node + 1]]:
+                if node_flags[first]:
+                    # Doğrudan komşu iki düğüm: kenar bir kez, küçük uçtan kaydedilir
+                    if node < first:
+                        ends.append((node, first))
+                        runs.append(())
+                    continue
+                if seen[first]:
+                    continue  # Bu koridor diğer ucundan kaydedildi
+                run = []
+                previous, cell = node, first
+                while not node_flags[cell]:
+                    run.append(cell)
+                    seen[cell] = 1
+                    following = targets[offsets[cell]]
+                    if following == previous:
+                        following = targets[offsets[cell] + 1]
+                    previous, cell = cell, following
+                if cell != node:  # Kendine dönen halka kısa yola katkı sağlamaz
+                    ends.append((node, cell))
+                    runs.append(run)
+
+        corridor_ends = node_of[np.array(ends, dtype=np.int32).reshape(-1, 2)]
+        run_lengths = np.array([len(run) for run in runs], dtype=np.int64)
+        cell_offsets = np.zeros(len(runs) + 1, dtype=np.int64)
+        np.cumsum(run_lengths, out=cell_offsets[1:])
+        cells = np.fromiter((cell for run in runs for cell in run), dtype=np.int32, count=int(cell_offsets[-1]))
+
+        # Her koridor iki yönlü kenar olarak düğüm sırasına göre CSR'a yerleştirilir
+        corridor_ids = np.arange(len(runs), dtype=np.int32)
+        sources = np.concatenate([corridor_ends[:, 0], corridor_ends[:, 1]])
+        order = np.argsort(sources, kind="stable")
+        edge_offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=len(nodes)), out=edge_offsets[1:])
+        edge_targets = np.concatenate([corridor_ends[:, 1], corridor_ends[:, 0]])[order]
+        edge_corridors = np.concatenate([corridor_ids, corridor_ids])[order]
+        edge_lengths = (run_lengths + 1).astype(np.int32)[edge_corridors]
+        return cls(nodes, node_of, edge_offsets, edge_targets, edge_lengths, edge_corridors,
+                   corridor_ends, cell_offsets, cells)
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    @property
+    def corridor_count(self):
+        return len(self.corridor_ends)
+
+    def edges(self, node):
+        """Bir düğümün (komşu düğümler, uzunluklar, koridor numaraları) dizileri."""
+        first, last = self.offsets[node], self.offsets[node + 1]
+        return self.targets[first:last], self.lengths[first:last], self.corridors[first:last]
+
+    def corridor_cells(self, corridor, from_node):
+        """Koridorun iç hücreleri, from_node tarafından başlayarak sıralı."""
+        run = self.cells[self.cell_offsets[corridor]:self.cell_offsets[corridor + 1]]
+        return run if self.corridor_ends[corridor, 0] == from_node else run[::-1]
+
+    def expand(self, node_path, corridor_path):
+        """Düğüm yolunu ve aradaki koridorları hücre indeksi listesine aç."""
+        path = [int(self.nodes[node_path[0]])]
+        for node, corridor, following in zip(node_path, corridor_path, node_path[1:]):
+            path.extend(self.corridor_cells(corridor, node).tolist())
+            path.append(int(self.nodes[following]))
+        return path
+
+    def shortest_path(self, source, target):
+        """İki düğüm hücresi arasındaki en kısa yolu Dijkstra ile hücre listesi olarak bul.
+
+        Yol yoksa boş liste döner. source ve target, graf oluşturulurken
+        terminals içinde verilmiş (ya da zaten düğüm olan) hücreler olmalıdır.
+        """
+        source_node, target_node = int(self.node_of[source]), int(self.node_of[target])
+        if source_node == NO_PARENT or target_node == NO_PARENT:
+            raise ValueError("source ve target kavşak grafının düğümleri olmalı")
+        if self._edge_lists is None:
+            self._edge_lists = (self.offsets.tolist(), self.targets.tolist(),
+                                self.lengths.tolist(), self.corridors.tolist())
+        offsets, targets, lengths, corridors = self._edge_lists
+
+        distance = {source_node: 0}
+        came_from = {source_node: (NO_PARENT, NO_PARENT)}
+        heap = [(0, source_node)]
+        while heap:
+            current_distance, node = heapq.heappop(heap)
+            if node == target_node:
+                break
+            if current_distance > distance[node]:
+                continue
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                candidate = current_distance + lengths[edge]
+                if candidate < distance.get(neighbor, INF_DISTANCE):
+                    distance[neighbor] = candidate
+                    came_from[neighbor] = (node, corridors[edge])
+                    heapq.heappush(heap, (candidate, neighbor))
+        if target_node not in came_from:
+            return []
+
+        node_path, corridor_path = [target_node], []
+        while node_path[-1] != source_node:
+            node, corridor = came_from[node_path[-1]]
+            node_path.append(node)
+            corridor_path.append(corridor)
+        node_path.reverse()
+        corridor_path.reverse()
+        return self.expand(node_path, corridor_path)
+
+
+class TreeIndex:
+    """Mükemmel (döngüsüz, bağlı) labirentler için LCA tabanlı yol indeksi.
+
+    Mükemmel labirent bir kapsayan ağaçtır; iki hücre arasındaki tek yol
+    ortak en yakın atadan (LCA) geçer. Ağaç root hücresinden köklenir,
+    depth her hücrenin derinliği, up[k] ise her hücrenin 2**k üstteki
+    atasıdır (kök kendine bakar). İki hücre arası mesafe O(log n), yol O(yol)
+    sürede arama yapmadan bulunur.
+    """
+    __slots__ = ("root", "depth", "up")
+
+    def __init__(self, root, depth, up):
+        self.root = root
+        self.depth = depth
+        self.up = up
+
+    @classmethod
+    def from_adjacency(cls, adjacency, root=0):
+        """Ağacı köklendir ve ikili atlama tablolarını vektörel olarak oluştur."""
+        size = len(adjacency.offsets) - 1
+        if len(adjacency.targets) != 2 * (size - 1):
+            raise ValueError("Labirent mükemmel değil: kenar sayısı hücre sayısının bir eksiği olmalı")
+        field = DistanceField.from_adjacency(adjacency, root)
+        if field.distance.max() == INF_DISTANCE:
+            raise ValueError("Labirent mükemmel değil: bazı hücrelere ulaşılamıyor")
+
+        parent = field.parent.copy()
+        parent[root] = root
+        up = np.empty((max(1, int(field.levels).bit_length()), size), dtype=np.int32)
+        up[0] = parent
+        for k in range(1, len(up)):
+            up[k] = up[k - 1][up[k - 1]]
+        return cls(root, field.distance, up)
+
+    @property
+    def nbytes(self):
+        return self.depth.nbytes + self.up.nbytes
+
+    def lca(self, a, b):
+        """İki hücrenin ortak en yakın atası (O(log n))."""
+        up, depth = self.up, self.depth
+        if depth[a] < depth[b]:
+            a, b = b, a
+        difference = int(depth[a] - depth[b])
+        k = 0
+        while difference:
+            if difference & 1:
+                a = up[k, a]
+            difference >>= 1
+            k += 1
+        if a == b:
+            return int(a)
+        for k in range(len(up) - 1, -1, -1):
+            if up[k, a] != up[k, b]:
+                a, b = up[k, a], up[k, b]
+        return int(up[0, a])
+
+    def distance(self, a, b):
+        """İki hücre arasındaki yol uzunluğu (O(log n))."""
+        return int(self.depth[a] + self.depth[b] - 2 * self.depth[self.lca(a, b)])
+
+    def path(self, a, b):
+        """a'dan b'ye tek yol (hücre indeksleri), O(yol)."""
+        ancestor = self.lca(a, b)
+        parent = self.up[0]
+        head, tail = [int(a)], [int(b)]
+        while head[-1] != ancestor:
+            head.append(int(parent[head[-1]]))
+        while tail[-1] != ancestor:
+            tail.append(int(parent[tail[-1]]))
+        tail.pop()
+        tail.reverse()
+        return head + tail
+
+    def lca_many(self, a, b):
+        """Dizi halindeki sorgu çiftleri için LCA'lar (tüm sorgular birlikte, O(log n) NumPy adımı)."""
+        up, depth = self.up, self.depth
+        a = np.asarray(a, dtype=np.int64).copy()
+        b = np.asarray(b, dtype=np.int64).copy()
+        swap = depth[a] < depth[b]
+        a[swap], b[swap] = b[swap], a[swap]
+        difference = depth[a] - depth[b]
+        for k in range(len(up)):
+            lift = ((difference >> k) & 1) == 1
+            a[lift] = up[k][a[lift]]
+        for k in range(len(up) - 1, -1, -1):
+            up_a, up_b = up[k][a], up[k][b]
+            differ = up_a != up_b
+            a = np.where(differ, up_a, a)
+            b = np.where(differ, up_b, b)
+        return np.where(a == b, a, up[0][a])
+
+    def distance_many(self, a, b):
+        """Dizi halindeki sorgu çiftleri için yol uzunlukları."""
+        depth = self.depth
+        return depth[a] + depth[b] - 2 * depth[self.lca_many(a, b)]
+
+
+class RandomFrontier:
+    """Prim algoritması için O(1) ekleme, üyelik ve rastgele çıkarma destekleyen küme.
+
+    Elemanlar bir listede tutulur; positions dizisi her hücrenin listedeki
+    yerini (yoksa -1) saklar. Rastgele çıkarmada son eleman boşluğa taşınır.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.items = []
+        self.positions = None  # İlk eklemede oluşturulur
+
+    def add(self, index):
+        if self.positions is None:
+            self.positions = np.full(self.size, -1, dtype=np.int32)
+        if self.positions[index] == -1:
+            self.positions[index] = len(self.items)
+            self.items.append(index)
+
+    def pop_random(self, rng):
+        """Kümeden düzgün dağılımla rastgele bir eleman çıkar."""
+        position = rng.randrange(len(self.items))
+        index = self.items[position]
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last] = position
+        self.positions[index] = -1
+        return index
+
+    def __contains__(self, index):
+        return self.positions is not None and self.positions[index] != -1
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+# Satır satır (NumPy ile) çalışan üreticiler
+ROW_GENERATORS = ("binary_tree", "sidewinder", "ellers_algorithm")
+GENERATION_ALGORITHMS = ("recursive_backtracking", "prims_algorithm") + ROW_GENERATORS
+
+# Satır bazlı üreticilerde generate() her seferinde en fazla bu kadar hücreyi işler
+GENERATION_CHUNK_CELLS = 1 << 22
+
+
+def join_row_sets(labels, candidates):
+    """Bir satırdaki aday yatay geçişlerden küme döngüsü oluşturmayanları seç.
+
+    candidates, labels[col] != labels[col + 1] olan artan sütunlardır. Aynı
+    küme satırda birden çok yerde bulunabildiği için geçişler bir yayılan
+    orman oluşturacak şekilde vektörel Borůvka turlarıyla seçilir: her küme
+    kendine değen en soldaki geçişi alır. (açılan sütunlar, yeni etiketler)
+    döndürür.
+    """
+    size = len(labels)
+    roots = np.arange(size)
+    columns = candidates
+    left = labels[columns]
+    right = labels[columns + 1]
+    joined = []
+
+    while len(columns):
+        a = roots[left]
+        b = roots[right]
+        keep = a != b
+        columns, left, right, a, b = columns[keep], left[keep], right[keep], a[keep], b[keep]
+        if not len(columns):
+            break
+
+        # Sütunlar artan sırada; her kök en küçük sıradaki geçişini seçer
+        edges = np.arange(len(columns))
+        best = np.full(size, len(columns))
+        np.minimum.at(best, a, edges)
+        np.minimum.at(best, b, edges)
+        components = np.flatnonzero(best < len(columns))
+        best = best[components]
+        chosen = np.zeros(len(columns), dtype=bool)
+        chosen[best] = True
+        joined.append(columns[chosen])
+
+        # Her kök geçişin öbür ucuna bağlanır; karşılıklı seçimlerde küçük kök kalır
+        other = np.where(a[best] == components, b[best], a[best])
+        roots[components] = other
+        mutual = (roots[other] == components) & (components < other)
+        roots[components[mutual]] = components[mutual]
+        while True:
+            next_roots = roots[roots]
+            if np.array_equal(next_roots, roots):
+                break
+            roots = next_roots
+
+    joined = np.concatenate(joined) if joined else np.empty(0, dtype=np.int64)
+    return joined, roots[labels]
+
+
+def ellers_rows(rows, cols, rng):
+    """Eller algoritmasıyla labirenti satır satır üret.
+
+    Her adımda bir satırın kesinleşmiş duvar bitlerini (uint8, uzunluk cols)
+    verir. Sadece mevcut satırın küme etiketleri tutulduğu için bellek O(cols)
+    kalır. Rastgele kararlar, dikey bağlantılar ve satır içi küme
+    birleştirmeleri (join_row_sets) vektöreldir.
+    """
+    labels = np.arange(cols)  # Her satırda 0..cols-1 aralığına sıkıştırılır
+    open_above = np.zeros(cols, dtype=bool)
+
+    for row in range(rows):
+        walls = np.full(cols, ALL_WALLS, dtype=np.uint8)
+        walls[open_above] &= 0xFF ^ WALL_TOP
+        last_row = row == rows - 1
+
+        # Yatay birleşmeler - son satırda farklı kümeler mutlaka birleştirilir
+        different = labels[:-1] != labels[1:]
+        if not last_row:
+            different &= rng.random(cols - 1) < 0.5
+        candidates = np.flatnonzero(different)
+
+        if len(candidates):
+            joined, labels = join_row_sets(labels, candidates)
+            walls[joined] &= 0xFF ^ WALL_RIGHT
+            walls[joined + 1] &= 0xFF ^ WALL_LEFT
+
+        if last_row:
+            yield walls
+            break
+
+        # Dikey bağlantılar - her kümeden en az bir hücre aşağı açılır
+        down = rng.random(cols) < 0.5
+        order = np.argsort(labels + rng.random(cols))  # Küme içinde rastgele sıra
+        sorted_labels = labels[order]
+        group_end = np.empty(cols, dtype=bool)
+        group_end[:-1] = sorted_labels[1:] != sorted_labels[:-1]
+        group_end[-1] = True
+        down[order[group_end]] = True
+        walls[down] &= 0xFF ^ WALL_BOTTOM
+
+        # Aşağı açılmayan hücreler bir sonraki satırda yeni küme başlatır
+        labels = np.where(down, labels, np.arange(cols) + cols)
+        present = np.zeros(2 * cols, dtype=bool)
+        present[labels] = True
+        labels = (np.cumsum(present) - 1)[labels]
+        open_above = down
+        yield walls
+
+
+def stream_ellers(rows, cols, sink, rng=None, seed=None):
+    """Eller algoritmasıyla labirenti tamamını bellekte tutmadan bir hedefe yaz.
+
+    sink ya write() metodu olan bir dosya nesnesidir (satırlar ham uint8 bayt
+    olarak art arda yazılır) ya da (rows, cols) veya (rows * cols,) biçimli bir
+    dizi (ör. numpy.memmap). Bellek kullanımı O(cols) kalır. rng verilmezse
+    seed ile yeni bir üreteç oluşturulur; aynı tohum Maze(seed=...) ile aynı
+    labirenti verir. Yazılan satır sayısını döndürür.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    written = 0
+    for row, walls in enumerate(ellers_rows(rows, cols, rng)):
+        if hasattr(sink, "write"):
+            sink.write(walls.tobytes())
+        elif np.ndim(sink) == 1:
+            sink[row * cols:(row + 1) * cols] = walls
+        else:
+            sink[row] = walls
+        written += 1
+    return written
+
+
+# İkili labirent dosya biçimi: sabit boyutlu başlık + satır sıralı uint8 duvar bitleri.
+# Duvar verisi HEADER_SIZE ofsetinden başlar, böylece numpy.memmap ile doğrudan eşlenebilir.
+MAZE_FILE_MAGIC = b"MAZE"
+MAZE_FILE_VERSION = 1
+MAZE_FILE_HEADER = struct.Struct("<4sHxxIIIIII32sq")  # magic, sürüm, boyut, başlangıç, bitiş, üretici, tohum
+MAZE_FILE_HEADER_SIZE = 128
+UNKNOWN_SEED = -1
+
+
+def write_maze_header(file, rows, cols, start, end, generator, seed=UNKNOWN_SEED):
+    """Labirent dosyası başlığını yaz. start ve end (satır, sütun) çiftleridir."""
+    header = MAZE_FILE_HEADER.pack(
+        MAZE_FILE_MAGIC, MAZE_FILE_VERSION, rows, cols,
+        start[0], start[1], end[0], end[1],
+        generator.encode("ascii")[:32], seed)
+    file.write(header.ljust(MAZE_FILE_HEADER_SIZE, b"\0"))
+
+
+def read_maze_header(file):
+    """Labirent dosyası başlığını oku ve alanları sözlük olarak döndür."""
+    data = file.read(MAZE_FILE_HEADER_SIZE)
+    if len(data) < MAZE_FILE_HEADER_SIZE:
+        raise ValueError("Labirent dosyası başlığı eksik")
+    magic, version, rows, cols, start_row, start_col, end_row, end_col, generator, seed = \
+        MAZE_FILE_HEADER.unpack_from(data)
+    if magic != MAZE_FILE_MAGIC:
+        raise ValueError("Geçerli bir labirent dosyası değil")
+    if version != MAZE_FILE_VERSION:
+        raise ValueError(f"Desteklenmeyen labirent dosyası sürümü: {version}")
+    return {
+        "rows": rows,
+        "cols": cols,
+        "start": (start_row, start_col),
+        "end": (end_row, end_col),
+        "generator": generator.rstrip(b"\0").decode("ascii"),
+        "seed": seed,
+    }
+
+
+def stream_ellers_to_file(path, rows, cols, seed=None):
+    """Eller labirentini başlığıyla birlikte doğrudan Maze.load ile açılabilir bir dosyaya akıt."""
+    with open(path, "wb") as file:
+        write_maze_header(file, rows, cols, (0, 0), (rows - 1, cols - 1), "ellers_algorithm",
+                          UNKNOWN_SEED if seed is None else seed)
+        stream_ellers(rows, cols, file, seed=seed)
+
+
 class Maze:
-    def __init__(self, rows, cols):
+    def __init__(self, rows, cols, walls=None, seed=None):
         self.rows = rows
         self.cols = cols
-        self.grid = [[Cell(i, j) for j in range(cols)] for i in range(rows)]
+        self.size = rows * cols
+
+        # Hücre verileri paralel dizilerde tutulur (indeks = satır * cols + sütun).
+        # walls verilirse (ör. dosyadan eşlenmiş bir numpy.memmap) kopyalanmadan kullanılır.
+        if walls is None:
+            walls = np.full(self.size, ALL_WALLS, dtype=np.uint8)
+        self.walls = walls
+        self.flags = np.zeros(self.size, dtype=np.uint8)
+        self._parent = None  # parent ve distance ilk kullanımda oluşturulur
+        self._distance = None
+        self.grid = MazeGrid(self)
+
+        # Çizim için: son kareden beri görünümü değişen hücreler. Çok sayıda hücre
+        # değişirse küme bırakılır ve full_redraw ile tüm labirent yeniden çizilir.
+        self.dirty_cells = set()
+        self.dirty_limit = max(1024, self.size // 8)
+        self.full_redraw = True
+        self.renderer = None  # İlk draw çağrısında oluşturulur (pygame gerektirir)
+
+        # Duvarlar her değiştiğinde artar; türetilmiş indeksler bununla geçersiz kılınır
+        self.walls_version = 0
+        self._adjacency = None
+        self._adjacency_version = -1
+        self._junction_graph = None
+        self._junction_graph_key = None
+
+        # Kaynak hücreye göre BFS mesafe alanı önbelleği (en son kullanılan sonda, LRU).
+        # Toplam boyut distance_cache_limit baytı aşınca en eski alanlar atılır.
+        self.distance_cache_limit = DISTANCE_CACHE_LIMIT
+        self._distance_fields = OrderedDict()
+        self._distance_fields_version = -1
+        self._distance_cache_bytes = 0
+        self.distance_cache_hits = 0
+        self.distance_cache_misses = 0
+        self._tree_index = None
+        self._tree_index_version = -1
+
         self.current_cell = None
-        self.stack = []  # Recursive Backtracking için
-        self.frontier = []  # Prim algoritması için
+        self.stack = []  # Recursive Backtracking için (hücre indeksleri)
+        self.frontier = RandomFrontier(self.size)  # Prim algoritması için (hücre indeksleri)
+        self.generation_row = 0  # Satır bazlı üreticiler için sıradaki satır
+        self.row_source = None  # Eller algoritmasının satır üreteci
+        # Labirente özel rastgele sayı üreteçleri - aynı tohum her platformda aynı labirenti verir
+        self.seed = seed
+        self.random = random.Random(seed)  # Adım adım üreticiler için
+        self.np_random = np.random.default_rng(seed)  # Vektörel üreticiler için
         self.generation_algorithm = "recursive_backtracking"
         self.generation_complete = False
         self.start_cell = None
@@ -57,25 +869,221 @@ class Maze:
         self.start_cell.is_start = True
         self.end_cell = self.grid[rows-1][cols-1]
         self.end_cell.is_end = True
-    
-    def set_generation_algorithm(self, algorithm):
+
+    @property
+    def parent(self):
+        if self._parent is None:
+            self._parent = np.full(self.size, NO_PARENT, dtype=np.int32)
+        return self._parent
+
+    @property
+    def distance(self):
+        if self._distance is None:
+            self._distance = np.full(self.size, INF_DISTANCE, dtype=np.int32)
+        return self._distance
+
+    def set_endpoints(self, start, end):
+        """Başlangıç ve bitiş hücrelerini (satır, sütun) çiftleriyle ayarla."""
+        for cell in (self.start_cell, self.end_cell):
+            if cell is not None:
+                cell.is_start = False
+                cell.is_end = False
+        self.start_cell = self.grid[start[0]][start[1]]
+        self.start_cell.is_start = True
+        self.end_cell = self.grid[end[0]][end[1]]
+        self.end_cell.is_end = True
+
+    def save(self, path):
+        """Labirenti ikili dosya biçiminde kaydet (başlık + duvar bitleri).
+
+        Tohum başlıkta int64 olarak saklanır; sığmayan bir tohum dosya
+        açılmadan ValueError verir.
+        """
+        seed = UNKNOWN_SEED if self.seed is None else self.seed
+        if not isinstance(seed, int) or not -2 ** 63 <= seed < 2 ** 63:
+            raise ValueError(f"Tohum dosya başlığına sığmıyor (int64 olmalı): {seed!r}")
+        with open(path, "wb") as file:
+            write_maze_header(file, self.rows, self.cols,
+                              (self.start_cell.row, self.start_cell.col),
+                              (self.end_cell.row, self.end_cell.col),
+                              self.generation_algorithm, seed)
+            np.ascontiguousarray(self.walls).tofile(file)
+
+    @classmethod
+    def load(cls, path, mode="r"):
+        """Kaydedilmiş labirenti duvarları kopyalamadan numpy.memmap ile aç.
+        
+        mode numpy.memmap'e iletilir: "r" salt okunur, "r+" dosyaya yazar,
+        "c" değişiklikleri sadece bellekte tutar. Sadece okunan sayfalar diskten yüklenir.
+        """
+        with open(path, "rb") as file:
+            header = read_maze_header(file)
+        walls = np.memmap(path, dtype=np.uint8, mode=mode, offset=MAZE_FILE_HEADER_SIZE,
+                          shape=(header["rows"] * header["cols"],))
+        seed = None if header["seed"] == UNKNOWN_SEED else header["seed"]
+        maze = cls(header["rows"], header["cols"], walls=walls, seed=seed)
+        maze.generation_algorithm = header["generator"]
+        maze.generation_complete = True
+        maze.set_endpoints(header["start"], header["end"])
+        return maze
+
+    def mark_dirty(self, index):
+        """Hücrenin bir sonraki karede yeniden çizilmesi gerektiğini işaretle."""
+        if not self.full_redraw:
+            self.dirty_cells.add(index)
+            if len(self.dirty_cells) > self.dirty_limit:
+                self.mark_all_dirty()
+
+    def mark_all_dirty(self):
+        """Tüm labirentin bir sonraki karede yeniden çizilmesini iste."""
+        self.full_redraw = True
+        self.dirty_cells = set()
+
+    def cell_at(self, index):
+        """Düz indeksten hücre görünümü oluştur."""
+        row, col = divmod(int(index), self.cols)
+        return Cell(self, row, col)
+
+    def index_of(self, row, col):
+        return row * self.cols + col
+
+    def set_walls(self, index, bits):
+        """Bir hücrenin tüm duvar bitlerini yaz."""
+        self.walls[index] = bits
+        self.walls_version += 1
+
+    def set_wall_bit(self, index, bit, present):
+        """Bir hücrenin tek bir duvar bitini aç/kapat."""
+        if present:
+            self.walls[index] |= bit
+        else:
+            self.walls[index] &= 0xFF ^ bit
+        self.walls_version += 1
+
+    def get_adjacency(self):
+        """Duvarsız komşuluk indeksini döndür, duvarlar değiştiyse yeniden oluştur."""
+        if self._adjacency is None or self._adjacency_version != self.walls_version:
+            self._adjacency = Adjacency.from_walls(self.walls, self.rows, self.cols)
+            self._adjacency_version = self.walls_version
+        return self._adjacency
+
+    def get_junction_graph(self):
+        """Kavşak grafını döndür; duvarlar ya da başlangıç/bitiş değiştiyse yeniden oluştur."""
+        key = (self.walls_version, self.start_cell.index, self.end_cell.index)
+        if self._junction_graph is None or self._junction_graph_key != key:
+            self._junction_graph = JunctionGraph.from_adjacency(
+                self.get_adjacency(), (self.start_cell.index, self.end_cell.index))
+            self._junction_graph_key = key
+        return self._junction_graph
+
+    def compute_distance_field(self, source=None):
+        """source hücresinden (varsayılan başlangıç) tüm labirentin BFS mesafe alanını hesapla."""
+        if source is None:
+            source = self.start_cell.index
+        return DistanceField.from_adjacency(self.get_adjacency(), source)
+
+    def get_distance_field(self, source=None):
+        """source hücresinin mesafe alanını önbellekten döndür, yoksa hesaplayıp ekle.
+
+        Duvarlar değiştiyse önbellek tamamen boşaltılır. Sınırı tek başına
+        aşan bir alan döndürülür ama saklanmaz.
+        """
+        if source is None:
+            source = self.start_cell.index
+        source = int(source)
+        fields = self._distance_fields
+        if self._distance_fields_version != self.walls_version:
+            self.clear_distance_cache()
+            self._distance_fields_version = self.walls_version
+
+        field = fields.get(source)
+        if field is not None:
+            fields.move_to_end(source)
+            self.distance_cache_hits += 1
+            return field
+
+        self.distance_cache_misses += 1
+        field = self.compute_distance_field(source)
+        self.cache_distance_field(field)
+        return field
+
+    def cache_distance_field(self, field):
+        """Başka yerde (ör. işçi süreçte) hesaplanmış bir mesafe alanını LRU önbelleğe ekle.
+
+        Alanın mevcut duvarlar üzerinde hesaplandığı varsayılır. Sınırı tek
+        başına aşan alan saklanmaz.
+        """
+        fields = self._distance_fields
+        if self._distance_fields_version != self.walls_version:
+            self.clear_distance_cache()
+            self._distance_fields_version = self.walls_version
+        previous = fields.pop(field.source, None)
+        if previous is not None:
+            self._distance_cache_bytes -= previous.nbytes
+        if field.nbytes <= self.distance_cache_limit:
+            fields[field.source] = field
+            self._distance_cache_bytes += field.nbytes
+        while self._distance_cache_bytes > self.distance_cache_limit:
+            _, evicted = fields.popitem(last=False)
+            self._distance_cache_bytes -= evicted.nbytes
+
+    def get_tree_index(self):
+        """Mükemmel labirent için LCA yol indeksini döndür; duvarlar değiştiyse yeniden oluştur.
+
+        Labirent mükemmel değilse (döngü ya da kopuk bölge varsa) ValueError yükselir.
+        """
+        if self._tree_index is None or self._tree_index_version != self.walls_version:
+            self._tree_index = TreeIndex.from_adjacency(self.get_adjacency())
+            self._tree_index_version = self.walls_version
+        return self._tree_index
+
+    def cached_distance_field(self, source):
+        """Önbellekte geçerli bir alan varsa döndür; hesaplamaz ve LRU sırasını değiştirmez."""
+        if self._distance_fields_version != self.walls_version:
+            return None
+        return self._distance_fields.get(int(source))
+
+    def shortest_path(self, target, *, source=None):
+        """source'tan (varsayılan başlangıç) target'a en kısa yol, önbellekteki mesafe alanından.
+
+        Aynı kaynaktan sonraki sorgular arama yapmadan O(yol) sürede yanıtlanır.
+        Hücre indeksi listesi döner; ulaşılamıyorsa boş liste. source, sırası
+        JunctionGraph.shortest_path(source, target) ile karışmasın diye
+        sadece anahtar sözcükle verilir.
+        """
+        return self.get_distance_field(source).path_to(target)
+
+    def clear_distance_cache(self):
+        """Önbellekteki tüm mesafe alanlarını bırak."""
+        self._distance_fields.clear()
+        self._distance_cache_bytes = 0
+
+    def set_generation_algorithm(self, algorithm, seed=None):
         self.generation_algorithm = algorithm
         self.generation_complete = False
         self.reset_maze()
         
+        # Üreteçleri her oluşturmada yeniden tohumla; böylece aynı tohum aynı labirenti verir
+        if seed is not None:
+            self.seed = seed
+        self.random = random.Random(self.seed)
+        self.np_random = np.random.default_rng(self.seed)
+        
         if algorithm == "recursive_backtracking":
             self.prepare_recursive_backtracking()
         elif algorithm == "prims_algorithm":
             self.prepare_prims_algorithm()
+        elif algorithm == "ellers_algorithm":
+            self.row_source = ellers_rows(self.rows, self.cols, self.np_random)
             
     def reset_maze(self):
         # Tüm hücreleri sıfırla
-        for row in self.grid:
-            for cell in row:
-                cell.walls = {"top": True, "right": True, "bottom": True, "left": True}
-                cell.visited = False
-                cell.in_maze = False
-                cell.reset_path_data()
+        self.walls.fill(ALL_WALLS)
+        self.walls_version += 1
+        self.flags.fill(0)
+        self._parent = None
+        self._distance = None
+        self.mark_all_dirty()
         
         # Başlangıç ve bitiş hücrelerini yeniden ayarla
         self.start_cell = self.grid[0][0]
@@ -84,18 +1092,29 @@ class Maze:
         self.end_cell.is_end = True
         
         self.stack = []
-        self.frontier = []
-    
+        self.frontier = RandomFrontier(self.size)
+        self.generation_row = 0
+        self.row_source = None
+
+    def reset_path_data(self):
+        """Tüm hücrelerin yol verilerini sıfırla (Cell.reset_path_data'nın toplu hali)."""
+        self.flags &= 0xFF ^ (FLAG_VISITED | FLAG_PATH | FLAG_SOLUTION)
+        self.mark_all_dirty()
+        if self._distance is not None:
+            self._distance.fill(INF_DISTANCE)
+        if self._parent is not None:
+            self._parent.fill(NO_PARENT)
+
     def prepare_recursive_backtracking(self):
         # Başlangıç hücresini seç
         self.current_cell = self.grid[0][0]
         self.current_cell.visited = True
-        self.stack.append(self.current_cell)
+        self.stack.append(self.current_cell.index)
     
     def prepare_prims_algorithm(self):
         # Başlangıç hücresini seç ve labirente ekle
         start_row, start_col = 0, 0
-        self.grid[start_row][start_col].in_maze = True
+        self.flags[self.index_of(start_row, start_col)] |= FLAG_IN_MAZE
         
         # Başlangıç hücresinin sınır komşularını ekle
         self.add_frontier_neighbors(start_row, start_col)
@@ -105,8 +1124,18 @@ class Maze:
         
         for dr, dc in directions:
             nr, nc = row + dr, col + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols and not self.grid[nr][nc].in_maze and not self.grid[nr][nc] in self.frontier:
-                self.frontier.append(self.grid[nr][nc])
+            if 0 <= nr < self.rows and 0 <= nc < self.cols:
+                index = self.index_of(nr, nc)
+                if not self.flags[index] & FLAG_IN_MAZE:
+                    self.frontier.add(index)
+                    self.mark_dirty(index)
+
+    def remove_wall(self, index, direction):
+        """Bir hücre ile verilen yöndeki komşusu arasındaki duvarı kaldır."""
+        bit, dr, dc, opposite = DIRECTIONS[direction]
+        self.walls[index] &= 0xFF ^ bit
+        self.walls[index + dr * self.cols + dc] &= 0xFF ^ opposite
+        self.walls_version += 1
     
     def remove_wall_between(self, current, next_cell):
         # İki hücre arasındaki duvarı kaldır
@@ -114,60 +1143,167 @@ class Maze:
         dy = next_cell.row - current.row
         
         if dx == 1:  # next_cell sağda
-            current.walls["right"] = False
-            next_cell.walls["left"] = False
+            self.remove_wall(current.index, "right")
         elif dx == -1:  # next_cell solda
-            current.walls["left"] = False
-            next_cell.walls["right"] = False
+            self.remove_wall(current.index, "left")
         elif dy == 1:  # next_cell aşağıda
-            current.walls["bottom"] = False
-            next_cell.walls["top"] = False
+            self.remove_wall(current.index, "bottom")
         elif dy == -1:  # next_cell yukarıda
-            current.walls["top"] = False
-            next_cell.walls["bottom"] = False
+            self.remove_wall(current.index, "top")
+    
+    def wall_grid(self):
+        """Duvar dizisinin (satır, sütun) biçimli görünümü (kopyasız)."""
+        return self.walls.reshape(self.rows, self.cols)
+    
+    def carve_east(self, row, mask):
+        """mask[i, c] doğruysa (row + i, c) ile sağ komşusu arasındaki duvarı kaldır."""
+        block = self.wall_grid()[row:row + len(mask)]
+        np.bitwise_and(block[:, :-1], 0xFF ^ WALL_RIGHT, out=block[:, :-1], where=mask)
+        np.bitwise_and(block[:, 1:], 0xFF ^ WALL_LEFT, out=block[:, 1:], where=mask)
+        self.walls_version += 1
+    
+    def carve_north(self, row, mask):
+        """mask[i, c] doğruysa (row + i, c) ile üst komşusu arasındaki duvarı kaldır."""
+        if row == 0:
+            # En üst satırın yukarısı yok
+            mask = mask[1:]
+            row = 1
+        grid = self.wall_grid()
+        block = grid[row:row + len(mask)]
+        above = grid[row - 1:row - 1 + len(mask)]
+        np.bitwise_and(block, 0xFF ^ WALL_TOP, out=block, where=mask)
+        np.bitwise_and(above, 0xFF ^ WALL_BOTTOM, out=above, where=mask)
+        self.walls_version += 1
+    
+    def carve_binary_tree(self, start, stop):
+        """İkili Ağaç: her hücre rastgele kuzeye ya da doğuya açılır."""
+        north = self.np_random.random((stop - start, self.cols)) < 0.5
+        north[:, -1] = True  # Son sütun sadece kuzeye açılabilir
+        if start == 0:
+            north[0] = False  # En üst satır sadece doğuya açılabilir
+        self.carve_east(start, ~north[:, :-1])
+        self.carve_north(start, north)
+    
+    def carve_sidewinder(self, start, stop):
+        """Sidewinder: doğuya koşular oluştur, her koşudan rastgele bir hücreyi kuzeye aç."""
+        rows = stop - start
+        # Hücre başına iki sayı: koşuyu kapatma kararı ve koşu içi seçim. Bloğun
+        # boyutundan bağımsız aynı sırada çekildikleri için tohumlu sonuç değişmez.
+        draws = self.np_random.random((rows, self.cols, 2))
+        close = draws[:, :, 0] < 0.5
+        if start == 0:
+            close[0] = False  # En üst satır tek bir koridordur
+        close[:, -1] = True  # Koşular satır sonunda kapanır
+        self.carve_east(start, ~close[:, :-1])
+        
+        # Her koşunun başlangıcı ve uzunluğu, satırlar düzleştirilerek bulunur
+        run_ends = np.flatnonzero(close.reshape(-1))
+        run_starts = np.empty_like(run_ends)
+        run_starts[0] = 0
+        run_starts[1:] = run_ends[:-1] + 1
+        lengths = run_ends - run_starts + 1
+        picks = draws[:, :, 1].reshape(-1)[run_ends]
+        chosen = run_starts + (picks * lengths).astype(np.int64)
+        
+        north = np.zeros(rows * self.cols, dtype=bool)
+        north[chosen] = True
+        self.carve_north(start, north.reshape(rows, self.cols))
+    
+    def carve_ellers(self, start, stop):
+        """Eller algoritması: satırları ellers_rows üretecinden sırayla yaz."""
+        grid = self.wall_grid()
+        for row in range(start, stop):
+            grid[row] = next(self.row_source)
+        self.walls_version += 1
+    
+    def row_generation_step(self, row_count=1):
+        """Satır bazlı üreticiyle sıradaki row_count satırı oluştur."""
+        if self.generation_row >= self.rows:
+            self.generation_complete = True
+            return True
+        
+        carvers = {
+            "binary_tree": self.carve_binary_tree,
+            "sidewinder": self.carve_sidewinder,
+            "ellers_algorithm": self.carve_ellers,
+        }
+        stop = min(self.generation_row + row_count, self.rows)
+        carvers[self.generation_algorithm](self.generation_row, stop)
+        self.generation_row = stop
+        self.current_cell = self.grid[stop - 1][self.cols - 1]
+        return False
+    
+    def generate(self):
+        """Labirent oluşturmayı görselleştirme olmadan sonuna kadar çalıştır.
+
+        set_generation_algorithm hiç çağrılmadıysa seçili üretici önce hazırlanır.
+        """
+        if self.generation_algorithm not in GENERATION_ALGORITHMS:
+            raise ValueError(f"Bilinmeyen labirent oluşturma algoritması: {self.generation_algorithm}")
+        if not self.generation_complete and not self.generation_prepared():
+            self.set_generation_algorithm(self.generation_algorithm)
+        if self.generation_algorithm in ROW_GENERATORS:
+            # Satır bazlı üreticiler tüm ızgarayı büyük bloklar halinde işler
+            chunk = max(1, GENERATION_CHUNK_CELLS // self.cols)
+            while not self.row_generation_step(chunk):
+                pass
+        while not self.generate_step():
+            pass
+    
+    def generation_prepared(self):
+        """Üretici durumu hazır mı: yığın, sınır ya da satır kaynağı dolu veya satır ilerlemiş."""
+        return (bool(self.stack) or len(self.frontier) > 0 or self.row_source is not None
+                or self.generation_row > 0)
     
     def generate_step(self):
         if self.generation_complete:
             return True
         
+        finished = False
         if self.generation_algorithm == "recursive_backtracking":
-            return self.recursive_backtracking_step()
+            finished = self.recursive_backtracking_step()
         elif self.generation_algorithm == "prims_algorithm":
-            return self.prims_algorithm_step()
+            finished = self.prims_algorithm_step()
+        elif self.generation_algorithm in ROW_GENERATORS:
+            finished = self.row_generation_step()
         
-        return False
+        if finished:
+            # Oluşturma renkleri (Prim sınırı vb.) artık gösterilmeyecek
+            self.mark_all_dirty()
+        return finished
     
     def recursive_backtracking_step(self):
         if not self.stack:
             self.generation_complete = True
             return True
         
-        self.current_cell = self.stack[-1]
+        current = self.stack[-1]
+        row, col = divmod(current, self.cols)
         
         # Tüm komşuları kontrol et (hücreler arasındaki duvarlar dahil)
         unvisited_neighbors = []
-        row, col = self.current_cell.row, self.current_cell.col
-        directions = [("top", -1, 0), ("right", 0, 1), ("bottom", 1, 0), ("left", 0, -1)]
-        
-        for direction, dr, dc in directions:
+        for direction in WALL_NAMES:
+            _, dr, dc, _ = DIRECTIONS[direction]
             nr, nc = row + dr, col + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols and not self.grid[nr][nc].visited:
-                unvisited_neighbors.append((direction, self.grid[nr][nc]))
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and not self.flags[nr * self.cols + nc] & FLAG_VISITED:
+                unvisited_neighbors.append((direction, nr * self.cols + nc))
         
         if unvisited_neighbors:
             # Rastgele bir komşu seç
-            direction, next_cell = random.choice(unvisited_neighbors)
+            direction, next_index = self.random.choice(unvisited_neighbors)
             
             # Duvarı kaldır
-            self.remove_wall_between(self.current_cell, next_cell)
+            self.remove_wall(current, direction)
             
             # Yeni hücreyi işaretle ve yığına ekle
-            next_cell.visited = True
-            self.stack.append(next_cell)
-            self.current_cell = next_cell
+            self.flags[next_index] |= FLAG_VISITED
+            self.mark_dirty(next_index)
+            self.stack.append(next_index)
+            self.current_cell = self.cell_at(next_index)
         else:
             # Geri izleme
             self.stack.pop()
+            self.current_cell = self.cell_at(current)
         
         return False
     
@@ -177,97 +1313,47 @@ class Maze:
             return True
         
         # Rastgele bir sınır hücresi seç
-        current_index = random.randint(0, len(self.frontier) - 1)
-        current = self.frontier.pop(current_index)
+        current = self.frontier.pop_random(self.random)
+        row, col = divmod(current, self.cols)
         
         # Labirentteki komşuları bul
         maze_neighbors = []
-        directions = [("top", -1, 0), ("right", 0, 1), ("bottom", 1, 0), ("left", 0, -1)]
-        
-        for direction, dr, dc in directions:
-            nr, nc = current.row + dr, current.col + dc
-            if 0 <= nr < self.rows and 0 <= nc < self.cols and self.grid[nr][nc].in_maze:
-                maze_neighbors.append((direction, self.grid[nr][nc]))
+        for direction in WALL_NAMES:
+            _, dr, dc, _ = DIRECTIONS[direction]
+            nr, nc = row + dr, col + dc
+            if 0 <= nr < self.rows and 0 <= nc < self.cols and self.flags[nr * self.cols + nc] & FLAG_IN_MAZE:
+                maze_neighbors.append(direction)
         
         if maze_neighbors:
             # Rastgele bir labirent komşusu seç
-            direction, maze_neighbor = random.choice(maze_neighbors)
+            direction = self.random.choice(maze_neighbors)
             
             # Duvarı kaldır
-            self.remove_wall_between(current, maze_neighbor)
+            self.remove_wall(current, direction)
             
             # Hücreyi labirente ekle
-            current.in_maze = True
+            self.flags[current] |= FLAG_IN_MAZE
+            self.mark_dirty(current)
             
             # Yeni hücrenin sınır komşularını ekle
-            self.add_frontier_neighbors(current.row, current.col)
+            self.add_frontier_neighbors(row, col)
             
-            self.current_cell = current
+            self.current_cell = self.cell_at(current)
         
         return False
     
-    def draw(self, screen, cell_size, offset_x=0, offset_y=0):
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = self.grid[row][col]
-                x = col * cell_size + offset_x
-                y = row * cell_size + offset_y
-                
-                # Arka plan rengini belirle
-                color = (0, 0, 0)  # Arka plan siyah
-                
-                if cell.is_solution:
-                    # Çözüm yolundaki hücreler sarı
-                    color = (255, 255, 0)  # Sarı
-                elif cell.visited:
-                    # Ziyaret edilmiş hücreler için kırmızının %40 opaklıktaki tonu
-                    color = (102, 0, 0)  # Kırmızının %40 opaklıktaki tonu
-                elif not self.generation_complete and self.generation_algorithm == "prims_algorithm":
-                    if cell.in_maze:
-                        # Prim algoritmasında labirente eklenmiş hücreler için kırmızının %40 opaklıktaki tonu
-                        color = (102, 0, 0)  # Kırmızının %40 opaklıktaki tonu
-                
-                # Hücre arka planını çiz
-                pygame.draw.rect(screen, color, (x, y, cell_size, cell_size))
-                
-                # Prim algoritması için sınır hücrelerini farklı bir renkte göster (sadece oluşum aşamasında)
-                if not self.generation_complete and self.generation_algorithm == "prims_algorithm" and cell in self.frontier:
-                    # Sınır hücreleri için daha açık kırmızı
-                    pygame.draw.rect(screen, (153, 0, 0), (x, y, cell_size, cell_size))
-                
-                # Başlangıç ve bitiş noktalarını özel olarak göster
-                if cell.is_start:
-                    # Başlangıç hücresi için yeşil dikdörtgen
-                    pygame.draw.rect(screen, (0, 255, 0), (x, y, cell_size, cell_size))
-                    center_x = x + cell_size // 2
-                    center_y = y + cell_size // 2
-                    pygame.draw.circle(screen, (255, 0, 0), (center_x, center_y), cell_size // 4)
-                elif cell.is_end:
-                    # Bitiş hücresi için kırmızı dikdörtgen
-                    pygame.draw.rect(screen, (255, 0, 0), (x, y, cell_size, cell_size))
-                
-                # Duvarları çiz (kırmızı renkte)
-                line_width = max(2, cell_size // 10)
-                wall_color = (255, 0, 0)  # Duvarlar kırmızı
-                if cell.walls["top"]:
-                    pygame.draw.line(screen, wall_color, (x, y), (x + cell_size, y), line_width)
-                if cell.walls["right"]:
-                    pygame.draw.line(screen, wall_color, (x + cell_size, y), (x + cell_size, y + cell_size), line_width)
-                if cell.walls["bottom"]:
-                    pygame.draw.line(screen, wall_color, (x, y + cell_size), (x + cell_size, y + cell_size), line_width)
-                if cell.walls["left"]:
-                    pygame.draw.line(screen, wall_color, (x, y), (x, y + cell_size), line_width)
+    def draw(self, screen, cell_size, offset_x=0, offset_y=0, algorithm=None):
+        # Çizim pygame gerektirir; çekirdek modelin pygame'siz yüklenebilmesi için adaptör burada yüklenir
+        # algorithm verilirse ziyaret/çözüm renkleri o algoritmanın kendi dizilerinden okunur
+        if self.renderer is None:
+            from renderer import MazeRenderer
+            self.renderer = MazeRenderer()
+        self.renderer.draw(self, screen, cell_size, offset_x, offset_y, algorithm)
     
     def clear_solution(self):
         """Labirentteki çözüm yollarını ve işaretleri temizle."""
-        for row in self.grid:
-            for cell in row:
-                # Hücre verilerini koruyarak sadece çözüm ile ilgili işaretleri temizle
-                cell.visited = False
-                cell.is_path = False
-                cell.is_solution = False
-                cell.distance = float('inf')
-                cell.parent = None
+        # Hücre verilerini koruyarak sadece çözüm ile ilgili işaretleri temizle
+        self.reset_path_data()
         
         # Başlangıç ve bitiş noktalarını yeniden işaretle
         self.start_cell.is_start = True
@@ -275,14 +1361,44 @@ class Maze:
     
     def clear_path_only(self):
         """Sadece geçici ziyaret izlerini temizle, çözüm yolunu koru."""
-        for row in self.grid:
-            for cell in row:
-                # Ziyaret bayraklarını temizle ama çözüm yolunu koru
-                if not cell.is_solution:
-                    cell.visited = False
+        # Ziyaret bayraklarını temizle ama çözüm yolunu koru
+        changed = np.flatnonzero((self.flags & (FLAG_SOLUTION | FLAG_VISITED)) == FLAG_VISITED)
+        self.flags[changed] &= 0xFF ^ FLAG_VISITED
+        for index in changed.tolist():
+            self.mark_dirty(index)
                     
         # Başlangıç ve bitiş noktalarını koruduğumuzdan emin olalım
         if self.start_cell:
             self.start_cell.is_start = True
         if self.end_cell:
-            self.end_cell.is_end = True 
\ No newline at end of file
+            self.end_cell.is_end = True
+
+
+def share_walls(walls):
+    """Duvar dizisini yeni bir paylaşılan bellek bloğuna kopyala; blok çağırana aittir (close/unlink)."""
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(create=True, size=walls.size)
+    np.ndarray(walls.size, dtype=np.uint8, buffer=shm.buf)[:] = walls
+    return shm
+
+
+@contextmanager
+def attached_maze(shm_name, rows, cols):
+    """share_walls ile paylaşılan duvarları kopyalamadan gören bir Maze ver.
+
+    Çıkışta labirentin duvar görünümü bırakılır ve blok kapatılır; Maze
+    nesnesi bloğun dışında kullanılmamalıdır.
+    """
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=shm_name)
+    maze = None
+    try:
+        maze = Maze(rows, cols, walls=np.ndarray(rows * cols, dtype=np.uint8, buffer=shm.buf))
+        maze.generation_complete = True
+        yield maze
+    finally:
+        # Paylaşılan belleğe bakan diziler kapatmadan önce bırakılmalı
+        if maze is not None:
+            maze.walls = None
+        maze = None
+        shm.close()
@@ -0,0 +1,230 @@
+import numpy as np
+import pygame
+from maze import (WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT,
+                  FLAG_VISITED, FLAG_IN_MAZE, FLAG_START, FLAG_END, FLAG_SOLUTION)
+
+# Labirentin pygame ile çizimi. maze.py bu modülü sadece çizim gerektiğinde yükler,
+# böylece labirent modeli ve çözücüler pygame/SDL olmadan kullanılabilir.
+
+# Hücre renkleri - palet indeksleri tam yeniden çizimde vektörel olarak kullanılır
+BACKGROUND = 0
+VISITED = 1
+FRONTIER = 2
+SOLUTION = 3
+START = 4
+END = 5
+BACKWARD = 6
+PALETTE = np.array([
+    (0, 0, 0),  # Arka plan siyah
+    (102, 0, 0),  # Kırmızının %40 opaklıktaki tonu (ziyaret edilen / Prim'de labirente eklenen)
+    (153, 0, 0),  # Prim sınır hücreleri için daha açık kırmızı
+    (255, 255, 0),  # Çözüm yolu sarı
+    (0, 255, 0),  # Başlangıç yeşil
+    (255, 0, 0),  # Bitiş kırmızı
+    (0, 0, 102),  # Çift yönlü aramada bitiş tarafından ziyaret edilenler koyu mavi
+], dtype=np.uint8)
+
+WALL_COLOR = (255, 0, 0)  # Duvarlar kırmızı
+WALL_COLORKEY = (255, 0, 255)  # Duvar katmanında saydam kabul edilen renk
+
+
+def cell_color_indices(maze, algorithm=None):
+    """Tüm hücrelerin palet indekslerini vektörel olarak hesapla.
+
+    algorithm verilirse ziyaret ve çözüm bilgisi labirent bayrakları yerine
+    algoritmanın kendi arama dizilerinden okunur.
+    """
+    flags = maze.flags
+    colors = np.zeros(maze.size, dtype=np.uint8)
+    generating_prim = not maze.generation_complete and maze.generation_algorithm == "prims_algorithm"
+
+    if generating_prim:
+        colors[(flags & FLAG_IN_MAZE) != 0] = VISITED
+    if algorithm is None:
+        colors[(flags & FLAG_VISITED) != 0] = VISITED
+        colors[(flags & FLAG_SOLUTION) != 0] = SOLUTION
+    else:
+        if algorithm.show_visited and algorithm.visited is not None:
+            colors[algorithm.visited] = VISITED
+            if algorithm.backward_visited is not None:
+                colors[algorithm.backward_visited] = BACKWARD
+        if algorithm.solution_cells:
+            colors[np.fromiter(algorithm.solution_cells, dtype=np.int64)] = SOLUTION
+    if generating_prim and maze.frontier.positions is not None:
+        colors[maze.frontier.positions != -1] = FRONTIER
+    colors[(flags & FLAG_END) != 0] = END
+    colors[(flags & FLAG_START) != 0] = START
+    return colors
+
+
+def cell_color_index(maze, index, algorithm=None):
+    """Tek bir hücrenin palet indeksi (cell_color_indices ile aynı öncelik sırası)."""
+    flags = maze.flags[index]
+    if flags & FLAG_START:
+        return START
+    if flags & FLAG_END:
+        return END
+    generating_prim = not maze.generation_complete and maze.generation_algorithm == "prims_algorithm"
+    if generating_prim and index in maze.frontier:
+        return FRONTIER
+    if algorithm is None:
+        solution = flags & FLAG_SOLUTION
+        visited = flags & FLAG_VISITED
+    else:
+        solution = index in algorithm.solution_cells
+        visited = algorithm.show_visited and algorithm.visited is not None and algorithm.visited[index]
+    if solution:
+        return SOLUTION
+    if visited and algorithm is not None and algorithm.backward_visited is not None \
+            and algorithm.backward_visited[index]:
+        return BACKWARD
+    if visited or (generating_prim and flags & FLAG_IN_MAZE):
+        return VISITED
+    return BACKGROUND
+
+
+def wall_edges(maze):
+    """Yatay (rows + 1, cols) ve dikey (rows, cols + 1) duvar kenarı maskeleri.
+
+    Bir kenar, iki yanındaki hücrelerden herhangi birinde duvar varsa çizilir.
+    """
+    walls = maze.wall_grid()
+    horizontal = np.zeros((maze.rows + 1, maze.cols), dtype=bool)
+    horizontal[:-1] |= (walls & WALL_TOP) != 0
+    horizontal[1:] |= (walls & WALL_BOTTOM) != 0
+    vertical = np.zeros((maze.rows, maze.cols + 1), dtype=bool)
+    vertical[:, :-1] |= (walls & WALL_LEFT) != 0
+    vertical[:, 1:] |= (walls & WALL_RIGHT) != 0
+    return horizontal, vertical
+
+
+def wall_mask(maze, cell_size, line_width):
+    """Duvar katmanının piksel maskesini NumPy ile çiz ((yükseklik, genişlik) bool dizisi).
+
+    Her kenar, line_width kalınlığında ve uçlarından yarım kalınlık taşan bir
+    bant olarak işaretlenir; katman line_width kadar kenar boşluğu içerir.
+    """
+    horizontal, vertical = wall_edges(maze)
+    pad = line_width
+    height = maze.rows * cell_size + 2 * pad + 1
+    width = maze.cols * cell_size + 2 * pad + 1
+    low = line_width // 2
+    offsets = range(-low, line_width - low)
+
+    # Yatay kenarlar: önce satır bazında x yönünde genişlet, sonra kalınlık kadar satıra yay
+    spans = np.zeros((maze.rows + 1, width), dtype=bool)
+    spans[:, pad:pad + maze.cols * cell_size] = np.repeat(horizontal, cell_size, axis=1)
+    spans = dilate(spans, offsets)
+    mask = np.zeros((height, width), dtype=bool)
+    line_rows = pad + np.arange(maze.rows + 1) * cell_size
+    for offset in offsets:
+        mask[line_rows + offset] |= spans
+
+    # Dikey kenarlar: aynı işlem sütunlar için
+    spans = np.zeros((maze.cols + 1, height), dtype=bool)
+    spans[:, pad:pad + maze.rows * cell_size] = np.repeat(vertical.T, cell_size, axis=1)
+    spans = dilate(spans, offsets)
+    line_cols = pad + np.arange(maze.cols + 1) * cell_size
+    for offset in offsets:
+        mask[:, line_cols + offset] |= spans.T
+    return mask
+
+
+def dilate(spans, offsets):
+    """Satır bazlı maskeleri verilen kaydırmalar kadar yatayda genişlet."""
+    result = spans.copy()
+    for offset in offsets:
+        if offset > 0:
+            result[:, offset:] |= spans[:, :-offset]
+        elif offset < 0:
+            result[:, :offset] |= spans[:, -offset:]
+    return result
+
+
+class MazeRenderer:
+    """Labirenti önbellekli yüzeylerle çizer.
+
+    Hücre renkleri ve duvarlar iki ayrı yüzeyde tutulur. Duvar katmanı sadece
+    maze.walls_version değiştiğinde yeniden çizilir; hücre katmanında ise her
+    karede sadece değişen hücreler güncellenir. Bir çözüm algoritması
+    verildiğinde değişen hücreler algoritmanın dirty_cells kümesinden, aksi
+    halde maze.dirty_cells kümesinden okunur.
+    """
+
+    def __init__(self):
+        self.maze = None
+        self.cell_size = None
+        self.line_width = 0
+        self.cells_surface = None
+        self.walls_surface = None
+        self.walls_version = -1
+        self.algorithm = None
+
+    def draw(self, maze, screen, cell_size, offset_x=0, offset_y=0, algorithm=None):
+        if maze is not self.maze or cell_size != self.cell_size:
+            self.allocate(maze, cell_size)
+        if algorithm is not self.algorithm:
+            # Gösterilen algoritma değişti; önceki hücre renkleri geçersiz
+            self.algorithm = algorithm
+            (algorithm or maze).mark_all_dirty()
+
+        source = maze if algorithm is None else algorithm
+        if source.full_redraw:
+            self.redraw_cells()
+        else:
+            for index in source.dirty_cells:
+                self.draw_cell(index)
+        source.dirty_cells.clear()
+        source.full_redraw = False
+
+        if self.walls_version != maze.walls_version:
+            self.redraw_walls()
+
+        screen.blit(self.cells_surface, (offset_x, offset_y))
+        screen.blit(self.walls_surface, (offset_x - self.line_width, offset_y - self.line_width))
+
+    def allocate(self, maze, cell_size):
+        """Labirent ya da hücre boyutu değişince yüzeyleri yeniden oluştur."""
+        self.maze = maze
+        self.cell_size = cell_size
+        self.line_width = max(2, cell_size // 10)
+        width, height = maze.cols * cell_size, maze.rows * cell_size
+        self.cells_surface = pygame.Surface((width, height))
+        self.walls_surface = pygame.Surface((width + 2 * self.line_width + 1, height + 2 * self.line_width + 1))
+        self.walls_surface.set_colorkey(WALL_COLORKEY)
+        self.walls_version = -1
+        (self.algorithm or maze).mark_all_dirty()
+
+    def redraw_cells(self):
+        """Hücre katmanını tek seferde yeniden oluştur (hücre başına bir piksel, sonra ölçekle)."""
+        maze = self.maze
+        colors = PALETTE[cell_color_indices(maze, self.algorithm)].reshape(maze.rows, maze.cols, 3)
+        small = pygame.surfarray.make_surface(colors.transpose(1, 0, 2))
+        pygame.transform.scale(small, self.cells_surface.get_size(), self.cells_surface)
+        self.draw_start_marker()
+
+    def draw_cell(self, index):
+        """Tek bir hücrenin arka planını yeniden çiz."""
+        row, col = divmod(index, self.maze.cols)
+        color = PALETTE[cell_color_index(self.maze, index, self.algorithm)].tolist()
+        size = self.cell_size
+        pygame.draw.rect(self.cells_surface, color, (col * size, row * size, size, size))
+        if index == self.maze.start_cell.index:
+            self.draw_start_marker()
+
+    def draw_start_marker(self):
+        # Başlangıç hücresinin ortasındaki kırmızı daire
+        start = self.maze.start_cell
+        size = self.cell_size
+        center = (start.col * size + size // 2, start.row * size + size // 2)
+        pygame.draw.circle(self.cells_surface, (255, 0, 0), center, size // 4)
+
+    def redraw_walls(self):
+        """Duvar katmanını piksel maskesinden tek seferde yeniden oluştur."""
+        mask = wall_mask(self.maze, self.cell_size, self.line_width)
+        pixels = np.empty(mask.shape + (3,), dtype=np.uint8)
+        pixels[:] = WALL_COLORKEY
+        pixels[mask] = WALL_COLOR
+        layer = pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
+        self.walls_surface.blit(layer, (0, 0))
+        self.walls_version = self.maze.walls_version
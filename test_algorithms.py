@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+from maze import Maze, share_walls
+from algorithms import _solve_groups_worker, solve, solve_many
+
+
+def make_maze():
+    maze = Maze(5, 5, seed=1)
+    maze.generate()
+    return maze
+
+
+@pytest.mark.parametrize("query", [((0, 0), (0, 5)), ((0, 0), (-1, 0)), ((5, 0), (0, 0))])
+def test_solve_many_rejects_out_of_bounds_queries(query):
+    with pytest.raises(ValueError):
+        solve_many(make_maze(), [query])
+
+
+def test_solve_many_workers_fill_distance_cache():
+    maze = make_maze()
+    result = solve_many(maze, [((0, 0), (4, 4)), ((2, 2), (0, 0))], max_workers=2)
+    assert result.lengths.tolist() == [
+        maze.get_distance_field(0).distance_to(24),
+        maze.get_distance_field(12).distance_to(0),
+    ]
+    assert maze.distance_cache_misses == 0
+
+
+def test_solve_groups_worker_returns_fields_within_budget():
+    maze = make_maze()
+    field_bytes = maze.compute_distance_field(0).nbytes
+    groups = [(source, [(source, 0)]) for source in range(maze.size)]
+    shm = share_walls(maze.walls)
+    try:
+        answers, fields = _solve_groups_worker(shm.name, maze.rows, maze.cols, groups, False, 3 * field_bytes)
+    finally:
+        shm.close()
+        shm.unlink()
+    assert len(answers) == maze.size
+    assert len(fields) == 3
+
+
+def test_solve_many_keeps_worker_fields_within_cache_limit():
+    maze = make_maze()
+    maze.distance_cache_limit = 2 * maze.compute_distance_field(0).nbytes
+    queries = [((row, col), (0, 0)) for row in range(5) for col in range(5)]
+    solve_many(maze, queries, paths=False, max_workers=2)
+    assert len(maze._distance_fields) <= 2
+
+
+def test_solve_stops_at_max_steps():
+    result = solve(make_maze(), "bfs", max_steps=1)
+    assert not result.completed
+    assert solve(make_maze(), "bfs").completed
+
+
+def test_solve_rejects_unknown_solver():
+    with pytest.raises(ValueError, match="bfs"):
+        solve(make_maze(), "bfss")
+
+
+def make_looped_maze(seed, size=15):
+    """Duvarları rastgele kırılmış, döngülü (mükemmel olmayan) bir labirent."""
+    rng = random.Random(seed)
+    maze = Maze(size, size, seed=seed)
+    maze.generate()
+    for _ in range(size * size // 4):
+        row, col = rng.randrange(size), rng.randrange(size - 1)
+        maze.remove_wall(maze.index_of(row, col), "right")
+        row, col = rng.randrange(size - 1), rng.randrange(size)
+        maze.remove_wall(maze.index_of(row, col), "bottom")
+    maze.set_endpoints((rng.randrange(size), rng.randrange(size)), (rng.randrange(size), rng.randrange(size)))
+    return maze
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("name, options", [
+    ("bidirectional_bfs", {}),
+    ("bidirectional_a_star", {}),
+    ("ids", {"schedule": "linear"}),
+    ("ids", {"schedule": "geometric"}),
+    ("ids", {"schedule": "ida_star"}),
+])
+def test_shortest_path_on_looped_mazes(seed, name, options):
+    maze = make_looped_maze(seed)
+    adjacency = maze.get_adjacency()
+    assert len(adjacency.targets) // 2 > maze.size - 1  # Gerçekten döngü var
+    reference = solve(maze, "bfs")
+    result = solve(maze, name, **options)
+    assert result.solution_found == reference.solution_found
+    assert result.path_length == reference.path_length
+    path = [maze.index_of(row, col) for row, col in result.path]
+    assert path[0] == maze.start_cell.index and path[-1] == maze.end_cell.index
+    for current, following in zip(path, path[1:]):
+        assert following in adjacency.neighbors(current).tolist()
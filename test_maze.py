@@ -0,0 +1,39 @@
+import pytest
+
+from maze import Maze, ALL_WALLS
+from algorithms import solve
+
+
+def test_generate_prepares_default_generator():
+    maze = Maze(5, 5, seed=1)
+    maze.generate()
+    assert maze.generation_complete
+    assert (maze.walls != ALL_WALLS).all()
+    result = solve(Maze(5, 5, seed=1), "bfs")
+    assert result.solution_found
+    assert result.path[0] == (0, 0) and result.path[-1] == (4, 4)
+
+
+def test_generate_rejects_unknown_generator():
+    maze = Maze(5, 5, seed=1)
+    maze.generation_algorithm = "no_such_generator"
+    with pytest.raises(ValueError):
+        maze.generate()
+
+
+def test_save_rejects_seed_outside_int64(tmp_path):
+    maze = Maze(3, 3, seed=2 ** 63)
+    maze.generate()
+    path = tmp_path / "maze.bin"
+    with pytest.raises(ValueError):
+        maze.save(path)
+    assert not path.exists()
+
+
+def test_shortest_path_source_is_keyword_only():
+    maze = Maze(5, 5, seed=1)
+    maze.generate()
+    path = maze.shortest_path(0, source=24)
+    assert path[0] == 24 and path[-1] == 0
+    with pytest.raises(TypeError):
+        maze.shortest_path(24, 0)
@@ -1,6 +1,7 @@
 import pygame
 import time
 from algorithms import *
+from renderer import MazeRenderer
 
 # Renkler
 WHITE = (255, 255, 255)
@@ -205,19 +206,26 @@ class UI:
         self.small_font = pygame.font.SysFont('Arial', 18)
         
         # Algoritma seçenekleri
-        self.generation_algorithms = ["recursive_backtracking", "prims_algorithm"]
+        self.generation_algorithms = ["recursive_backtracking", "prims_algorithm", "binary_tree", "sidewinder", "ellers_algorithm"]
         self.generation_algorithm_names = {
             "recursive_backtracking": "Recursive Backtracking",
-            "prims_algorithm": "Prim's Algorithm"
+            "prims_algorithm": "Prim's Algorithm",
+            "binary_tree": "Binary Tree",
+            "sidewinder": "Sidewinder",
+            "ellers_algorithm": "Eller's Algorithm"
         }
         
         # Türkçe isimleri koruyalım
         self.generation_algorithm_names_tr = {
             "recursive_backtracking": "Geriye İzleme",
-            "prims_algorithm": "Prim Algoritması"
+            "prims_algorithm": "Prim Algoritması",
+            "binary_tree": "İkili Ağaç",
+            "sidewinder": "Sidewinder",
+            "ellers_algorithm": "Eller Algoritması"
         }
         
-        self.solving_algorithms = ["wall_follower", "dijkstra", "dead_end_filling", "bfs", "dfs", "ids", "a_star"]
+        self.solving_algorithms = ["wall_follower", "dijkstra", "dead_end_filling", "bfs", "dfs", "ids", "a_star",
+                                   "bidirectional_bfs", "bidirectional_a_star", "corridor_jump"]
         self.solving_algorithm_names = {
             "wall_follower": "Wall Follower",
             "dijkstra": "Dijkstra",
@@ -225,7 +233,10 @@ class UI:
             "bfs": "Breadth First Search",
             "dfs": "Depth First Search",
             "ids": "Iterative Deepening Search",
-            "a_star": "A* Algorithm"
+            "a_star": "A* Algorithm",
+            "bidirectional_bfs": "Bidirectional BFS",
+            "bidirectional_a_star": "Bidirectional A*",
+            "corridor_jump": "Corridor Jump Search"
         }
         
         # Türkçe isimleri koruyalım
@@ -236,7 +247,10 @@ class UI:
             "bfs": "Genişlik Öncelikli Arama",
             "dfs": "Derinlik Öncelikli Arama",
             "ids": "Yinelemeli Derinleştirme",
-            "a_star": "A* Algoritması"
+            "a_star": "A* Algoritması",
+            "bidirectional_bfs": "Çift Yönlü BFS",
+            "bidirectional_a_star": "Çift Yönlü A*",
+            "corridor_jump": "Koridor Atlamalı Arama"
         }
         
         self.maze_size = 20  # Varsayılan labirent boyutu
@@ -289,16 +303,22 @@ class UI:
         
         # Algoritma seçimi bölümü - başlığı daha aşağıya alıyoruz
         y_pos = 330  # 290'dan 330'a çıkardım
+        # Algoritma butonları, altlarındaki sıfırla/karşılaştır butonları çıkış butonunun
+        # üstünde kalacak kadar sık dizilir
+        available = self.height - 60 - margin - y_pos - 2 * (button_height + margin) - 5
+        algo_step = min(button_height + margin, available // len(self.solving_algorithms))
+        algo_margin = 4
+        algo_button_height = algo_step - algo_margin
         for i, algo in enumerate(self.solving_algorithms):
             algo_button = Button(
                 self.panel_x + self.panel_width // 2 - button_width // 2,
                 y_pos,
-                button_width, button_height,
+                button_width, algo_button_height,
                 self.solving_algorithm_names[algo],
                 self.small_font
             )
             self.algorithm_buttons.append(algo_button)
-            y_pos += button_height + margin
+            y_pos += algo_button_height + algo_margin
         
         # Algoritma sıfırla butonu - bir punto yukarı taşı
         self.reset_algorithm_button = Button(
@@ -347,6 +367,15 @@ class UI:
                 "name": algo
             })
         
+        # Paralel karşılaştırma seçeneği - algoritmalar ayrı süreçlerde aynı anda çalışır
+        self.parallel_checkbox = {
+            "rect": pygame.Rect(self.width // 2 - 150, checkbox_start_y + len(self.solving_algorithms) * checkbox_margin + 20,
+                                checkbox_size, checkbox_size),
+            "selected": False
+        }
+        
+        self.comparison_renderers = []  # Karşılaştırma ekranındaki her labirent için önbellekli çizici
+        
         # Geri dön butonu
         self.back_button = Button(
             50, self.height - 70,
@@ -355,7 +384,7 @@ class UI:
             self.font
         )
     
-    def draw_main_screen(self, maze=None):
+    def draw_main_screen(self, maze=None, algorithm=None):
         """Ana ekranı çiz (labirent ve sağ panel)"""
         # Arka planı siyah yap
         self.screen.fill(BACKGROUND_COLOR)
@@ -379,9 +408,6 @@ class UI:
         gen_label_rect = gen_label.get_rect(center=(self.panel_x + self.panel_width // 2, 115))  # 85'den 115'e çıkardım
         self.screen.blit(gen_label, gen_label_rect)
         
-        # Dropdown'u çiz
-        self.generation_algorithm_dropdown.draw(self.screen)
-        
         # Labirent oluştur butonu
         self.generate_maze_button.draw(self.screen)
         
@@ -404,23 +430,26 @@ class UI:
         # Çıkış butonu
         self.quit_button.draw(self.screen)
         
+        # Dropdown'u en son çiz - açıkken seçenekleri butonların üzerinde kalsın
+        self.generation_algorithm_dropdown.draw(self.screen)
+        
         # Eğer labirent varsa çiz
         if maze:
-            self.draw_maze(maze)
+            self.draw_maze(maze, algorithm)
     
-    def draw_maze(self, maze):
-        """Labirenti çiz"""
+    def draw_maze(self, maze, algorithm=None):
+        """Labirenti çiz (algorithm verilirse onun ziyaret/çözüm durumuyla)"""
         # Labirent çizim boyutlarını hesapla (sağ paneli hesaba katarak)
         maze_area_width = self.width - self.panel_width
         maze_size = min(maze_area_width, self.height) - 80
-        cell_size = maze_size // max(maze.rows, maze.cols)
+        cell_size = max(1, maze_size // max(maze.rows, maze.cols))
         
         # Labirenti ortala
         offset_x = (maze_area_width - cell_size * maze.cols) // 2
         offset_y = (self.height - cell_size * maze.rows) // 2
         
         # Labirenti çiz
-        maze.draw(self.screen, cell_size, offset_x, offset_y)
+        maze.draw(self.screen, cell_size, offset_x, offset_y, algorithm)
     
     def draw_generation_info(self, maze):
         """Labirent oluşturma bilgilerini göster"""
@@ -430,7 +459,7 @@ class UI:
         info_font = pygame.font.SysFont('Arial', 20)
         
         # Kullanılan algoritmanın adını al
-        algorithm_name = "Recursive Backtracking" if maze.generation_algorithm == "recursive_backtracking" else "Prim's Algorithm"
+        algorithm_name = self.generation_algorithm_names.get(maze.generation_algorithm, maze.generation_algorithm)
         
         info_text = f"Algorithm: {algorithm_name} | Size: {maze.rows}x{maze.cols}"  # Algoritma -> Algorithm, Boyut -> Size
         
@@ -488,7 +517,11 @@ class UI:
         # Tam ekran boyutunu kullan
         maze_width = (self.width - 60) // cols
         maze_height = (self.height - 200) // rows
-        maze_size = min(maze_width // maze.cols, maze_height // maze.rows)
+        maze_size = max(1, min(maze_width // maze.cols, maze_height // maze.rows))
+        
+        # Karşılaştırma kutusu başına bir çizici
+        while len(self.comparison_renderers) < n_algos:
+            self.comparison_renderers.append(MazeRenderer())
         
         # Labirentler için başlangıç noktası (merkezde olacak şekilde)
         start_x = (self.width - (cols * (maze.cols * maze_size + 20))) // 2
@@ -530,70 +563,8 @@ class UI:
                 self.screen.blit(path_surface, (maze_x + maze.cols * maze_size // 2 - 40, maze_y - 60))
                 
                 # Labirenti çiz - önemli: HER ALGORİTMA KENDİ ÇÖZÜMÜNÜ GÖSTERMELİ
-                for row in range(maze.rows):
-                    for col in range(maze.cols):
-                        cell = maze.grid[row][col]
-                        cell_x = maze_x + col * maze_size
-                        cell_y = maze_y + row * maze_size
-                        
-                        # Arka plan rengini belirle
-                        color = (0, 0, 0)  # Arka plan siyah
-                        
-                        # İlgili algoritmanın visited/path/solution değerlerine göre renk belirle
-                        if hasattr(algorithm, 'visited_cells') and cell in algorithm.visited_cells:
-                            color = (102, 0, 0)  # Ziyaret edilmiş hücre için koyu kırmızı
-                        
-                        # ÖNEMLİ DEĞİŞİKLİK: Her algoritma kendi çözüm yolunu göstermeli
-                        # Bu hücre algoritmanın çözüm yolunda mı kontrol et
-                        if hasattr(algorithm, 'solution_found') and algorithm.solution_found:
-                            # Başlangıç hücresinden hedef hücreye parent ilişkisini izle
-                            current = maze.end_cell
-                            solution_path = [current]
-                            
-                            # Parent ilişkisini izleyerek çözüm yolunu oluştur
-                            while current and current != maze.start_cell:
-                                current = current.parent
-                                if current:
-                                    solution_path.append(current)
-                            
-                            # Bu hücre çözüm yolunda mı kontrol et
-                            if cell in solution_path:
-                                color = (255, 255, 0)  # Sarı - çözüm yolu
-                        
-                        # Başlangıç ve bitiş noktaları için renk kontrolü
-                        if cell.is_start:
-                            color = (0, 255, 0)  # Başlangıç hücresi için yeşil
-                        elif cell.is_end:
-                            color = (255, 0, 0)  # Bitiş hücresi için kırmızı
-                        
-                        # Hücre arka planını çiz
-                        pygame.draw.rect(self.screen, color, (cell_x, cell_y, maze_size, maze_size))
-                        
-                        # Başlangıç ve bitiş noktalarını özel olarak göster
-                        if cell.is_start:
-                            center_x = cell_x + maze_size // 2
-                            center_y = cell_y + maze_size // 2
-                            pygame.draw.circle(self.screen, (255, 0, 0), (center_x, center_y), maze_size // 4)
-                        
-                        # Duvarları çiz
-                        line_width = max(1, maze_size // 10)
-                        wall_color = (255, 0, 0)  # Duvarlar kırmızı
-                        if cell.walls["top"]:
-                            pygame.draw.line(self.screen, wall_color, 
-                                            (cell_x, cell_y), 
-                                            (cell_x + maze_size, cell_y), line_width)
-                        if cell.walls["right"]:
-                            pygame.draw.line(self.screen, wall_color, 
-                                            (cell_x + maze_size, cell_y), 
-                                            (cell_x + maze_size, cell_y + maze_size), line_width)
-                        if cell.walls["bottom"]:
-                            pygame.draw.line(self.screen, wall_color, 
-                                            (cell_x, cell_y + maze_size), 
-                                            (cell_x + maze_size, cell_y + maze_size), line_width)
-                        if cell.walls["left"]:
-                            pygame.draw.line(self.screen, wall_color, 
-                                            (cell_x, cell_y), 
-                                            (cell_x, cell_y + maze_size), line_width)
+                # Her kutunun kendi önbellekli çizicisi var; renkler algoritmanın dizilerinden okunur
+                self.comparison_renderers[algos_drawn].draw(maze, self.screen, maze_size, maze_x, maze_y, algorithm)
                 
                 algos_drawn += 1
         
@@ -651,6 +622,14 @@ class UI:
             text = pygame.font.SysFont('Arial', 18).render(algo_name, True, WHITE)  # Özel font kullanarak 24'ten 18'e düşür
             self.screen.blit(text, (checkbox["rect"].x + 30, checkbox["rect"].y))
         
+        # Paralel çalıştırma seçeneği
+        checkbox = self.parallel_checkbox
+        pygame.draw.rect(self.screen, WHITE, checkbox["rect"], 2)
+        if checkbox["selected"]:
+            pygame.draw.rect(self.screen, YELLOW, checkbox["rect"].inflate(-6, -6))
+        text = pygame.font.SysFont('Arial', 18).render("Run in parallel (one process per algorithm)", True, YELLOW)  # Paralel çalıştır
+        self.screen.blit(text, (checkbox["rect"].x + 30, checkbox["rect"].y))
+        
         # Başlat butonu - yazı rengini siyah yap ve puntosunu düşür
         start_compare_button = Button(
             self.width // 2 - 100, 
@@ -737,6 +716,11 @@ class UI:
                             print("En fazla 4 algoritma seçebilirsiniz!")
                     return None
             
+            # Paralel çalıştırma seçeneğini kontrol et
+            if self.parallel_checkbox["rect"].collidepoint(mouse_pos):
+                self.parallel_checkbox["selected"] = not self.parallel_checkbox["selected"]
+                return None
+            
             # Karşılaştırmayı başlat butonunu kontrol et
             if start_compare_button and start_compare_button.is_clicked(mouse_pos, event):
                 # En az 2, en fazla 4 algoritma seçildiğinden emin ol
@@ -772,7 +756,9 @@ class UI:
             
         # Eğer maze parametresi verilmişse, algoritmayı oluştur
         if maze:
-            return create_algorithm(self.selected_algorithm, maze)
+            # Menüde bilinmeyen bir ad kalmışsa arayüz BFS ile devam eder
+            name = self.selected_algorithm if self.selected_algorithm in ALGORITHMS else "bfs"
+            return create_algorithm(name, maze)
         else:
             # Aksi halde sadece adını içeren bir nesne döndür
             # Bu obje sadece görüntüleme amaçlı kullanılmalı, adım yürütmek için değil
@@ -792,6 +778,10 @@ class UI:
         
         return selected_algos
     
+    def is_parallel_comparison(self):
+        """Karşılaştırmanın süreç havuzunda çalıştırılıp çalıştırılmayacağı"""
+        return self.parallel_checkbox["selected"]
+    
     def handle_comparison_events(self, event):
         """Karşılaştırma ekranı olaylarını işle (sadece geri butonu için)"""
         mouse_pos = pygame.mouse.get_pos()